@@ -1,9 +1,13 @@
+import os
 import sys
+import time
 
 import pygame
 
 from cutscene import CutScene1, ScreenManager
+from frame_stats import FrameStats
 from menu import MenuScreen, TitleScreen
+from prebake import FrameBaker
 from tutorial_mana1 import (
     TutorialManaScreen1,
     TutorialManaScreen2,
@@ -15,6 +19,19 @@ from tutorial_text import TutorialTextScreen1, TutorialTextScreen2
 
 
 
+def register_screens(manager: ScreenManager, font: pygame.font.Font):
+    manager.add("TitleScreen", lambda: TitleScreen(manager, font))
+    manager.add("MenuScreen", lambda: MenuScreen(manager, font))
+    manager.add("CutScene1", lambda: CutScene1(manager, font), prebake=True)
+    manager.add("TutorialTextScreen1", lambda: TutorialTextScreen1(manager, font))
+    manager.add("TutorialTextScreen2", lambda: TutorialTextScreen2(manager, font))
+    manager.add("TutorialManaScreen1", lambda: TutorialManaScreen1(manager, font), assets=TutorialManaScreen1.assets)
+    manager.add("TutorialManaScreen2", lambda: TutorialManaScreen2(manager, font), assets=TutorialManaScreen2.assets)
+    manager.add("TutorialManaScreen3", lambda: TutorialManaScreen3(manager, font), assets=TutorialManaScreen3.assets)
+    manager.add("TutorialManaScreen4", lambda: TutorialManaScreen4(manager, font))
+    manager.add("TutorialManaScreen5", lambda: TutorialManaScreen5(manager, font), assets=TutorialManaScreen5.assets)
+
+
 def main():
     pygame.init()
     size = (800, 600)
@@ -23,31 +40,44 @@ def main():
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, 36)
 
-    manager = ScreenManager()
-    manager.add("TitleScreen", TitleScreen(manager, font))
-    manager.add("MenuScreen", MenuScreen(manager, font))
-    manager.add("CutScene1", CutScene1(manager, font))
-    manager.add("TutorialTextScreen1", TutorialTextScreen1(manager, font))
-    manager.add("TutorialTextScreen2", TutorialTextScreen2(manager, font))
-    manager.add("TutorialManaScreen1", TutorialManaScreen1(manager, font))
-    manager.add("TutorialManaScreen2", TutorialManaScreen2(manager, font))
-    manager.add("TutorialManaScreen3", TutorialManaScreen3(manager, font))
-    manager.add("TutorialManaScreen4", TutorialManaScreen4(manager, font))
-    manager.add("TutorialManaScreen5", TutorialManaScreen5(manager, font))
+    manager = ScreenManager(idle_timeout=60.0)
+    register_screens(manager, font)
+    # For slow machines: YELLOW_PREBAKE=memory, or a directory to keep the
+    # baked frames in between runs, plays cutscenes back from pre-rendered frames.
+    prebake = os.environ.get("YELLOW_PREBAKE")
+    if prebake:
+        manager.baker = FrameBaker(None if prebake == "memory" else prebake)
     manager.switch("TutorialManaScreen1")
 
+    # YELLOW_PROFILE=frames.csv (or .json) records per-screen frame timings,
+    # written there on exit and whenever F12 is pressed.
+    profile_path = os.environ.get("YELLOW_PROFILE")
+    if profile_path:
+        manager.stats = FrameStats()
+
     while manager.running:
         timestamp = clock.tick(60) / 1000.0
+        started = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 manager.quit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12 and manager.stats:
+                manager.stats.dump(profile_path)
             else:
                 manager.handle_event(event)
+        manager.record("event", time.perf_counter() - started)
 
         manager.update(timestamp)
-        manager.render(screen)
-        pygame.display.flip()
+        dirty = manager.render(screen)
+        started = time.perf_counter()
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        manager.record("flip", time.perf_counter() - started)
 
+    if manager.stats:
+        manager.stats.dump(profile_path)
     pygame.quit()
     sys.exit()
 
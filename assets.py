@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from typing import Iterable
+
+import pygame
+
+
+class AssetLoader:
+    """Cache of display-converted images, decoded ahead of time on a worker thread.
+
+    ``preload`` queues files to be read and decoded off the main thread.
+    Converting to the display format has to happen on the main thread, so
+    ``pump`` finishes decoded images a few at a time within a per-frame
+    budget. ``image`` always returns a converted surface: if the file was not
+    preloaded, or its decode has not finished yet, it loads or waits for it
+    there and then.
+    """
+
+    def __init__(self, convert_budget: float = 0.002):
+        self.convert_budget = convert_budget
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[str, Future] = {}
+        self._images: dict[str, pygame.Surface] = {}
+
+    def preload(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            if path in self._images or path in self._pending:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+            self._pending[path] = self._executor.submit(pygame.image.load, path)
+
+    def pump(self, budget: float | None = None) -> int:
+        """Convert decoded images until ``budget`` seconds are spent; returns how many."""
+        deadline = time.perf_counter() + (self.convert_budget if budget is None else budget)
+        converted = 0
+        for path, future in list(self._pending.items()):
+            if time.perf_counter() >= deadline:
+                break
+            if future.done():
+                self._finish(path)
+                converted += 1
+        return converted
+
+    def image(self, path: str) -> pygame.Surface:
+        image = self._images.get(path)
+        if image is None:
+            if path in self._pending:
+                image = self._finish(path)
+            else:
+                image = self._images[path] = pygame.image.load(path).convert_alpha()
+        return image
+
+    def is_ready(self, path: str) -> bool:
+        return path in self._images
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def discard(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self._images.pop(path, None)
+            future = self._pending.pop(path, None)
+            if future is not None:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+    def _finish(self, path: str) -> pygame.Surface:
+        image = self._pending.pop(path).result().convert_alpha()
+        self._images[path] = image
+        return image
+
+
+__all__ = ["AssetLoader"]
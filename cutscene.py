@@ -1,39 +1,166 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
 import pygame
 
+from assets import AssetLoader
+from cutscene_script import CutscenePlan, load_plan
+from frame_stats import FrameStats
+from timeline import Timeline
+
+if TYPE_CHECKING:
+    from prebake import FrameBaker
+
 
 class ScreenManager:
-    def __init__(self):
+    """Owns the screens and forwards the main loop to the active one.
+
+    Screens can be registered ready-made or as zero-argument factories; a
+    factory is only called on the first ``switch()`` to its name. Screens built
+    from a factory are dropped again once they have been inactive for
+    ``idle_timeout`` seconds, or when more than ``max_resident`` screens are
+    alive (least recently used first), and rebuilt when next needed.
+
+    The image files a screen loads can be declared with ``add(..., assets=)``.
+    After each switch the manager preloads the assets of the screens the new
+    one says come next (``Screen.upcoming``), and ``update`` spends up to
+    ``assets.convert_budget`` seconds a frame finishing them, so the switch
+    itself does not stall on decoding.
+
+    Setting ``stats`` to a ``FrameStats`` records how long each screen's
+    ``update`` and ``render`` take; the main loop adds the event and flip
+    phases with ``record``. When it is None the only cost is that check.
+
+    With a ``baker`` set, screens added with ``prebake=True`` (timeline
+    screens built from factories) are pre-rendered in the background when
+    they come up in ``upcoming``, and play back from that cache.
+    """
+
+    def __init__(self, max_resident: int | None = None, idle_timeout: float | None = None):
         self.screens: dict[str, "Screen"] = {}
+        self.factories: dict[str, Callable[[], "Screen"]] = {}
         self.active: "Screen" | None = None
+        self.active_name: str | None = None
         self.running: bool = True
+        self.max_resident = max_resident
+        self.idle_timeout = idle_timeout
+        self._last_used: dict[str, float] = {}
+        self.assets = AssetLoader()
+        self.screen_assets: dict[str, tuple[str, ...]] = {}
+        self.stats: FrameStats | None = None
+        self.baker: FrameBaker | None = None
+        self.prebaked: set[str] = set()
+
+    def add(
+        self,
+        name: str,
+        screen: "Screen" | Callable[[], "Screen"],
+        assets: Iterable[str] = (),
+        prebake: bool = False,
+    ):
+        self.screen_assets[name] = tuple(assets)
+        if prebake:
+            self.prebaked.add(name)
+        else:
+            self.prebaked.discard(name)
+        if isinstance(screen, Screen):
+            self.screens[name] = screen
+            self.factories.pop(name, None)
+        else:
+            self.factories[name] = screen
+            self.screens.pop(name, None)
 
-    def add(self, name: str, screen: "Screen"):
-        self.screens[name] = screen
+    def get(self, name: str) -> "Screen" | None:
+        screen = self.screens.get(name)
+        if screen is None and name in self.factories:
+            screen = self.factories[name]()
+            self.screens[name] = screen
+        return screen
 
     def switch(self, name: str):
         if self.active:
             self.active.on_exit()
-        self.active = self.screens.get(name)
+            self._last_used[self.active_name] = time.monotonic()
+        self.active = self.get(name)
+        self.active_name = name if self.active else None
         if self.active:
             self.active.on_enter()
+        self._release_idle()
+        if self.active:
+            for upcoming in self.active.upcoming():
+                self.preload(upcoming)
+
+    def preload(self, name: str):
+        self.assets.preload(self.screen_assets.get(name, ()))
+        if self.baker is not None and name in self.prebaked and name in self.factories:
+            surface = pygame.display.get_surface()
+            if surface is not None:
+                self.baker.request(name, self.factories[name], surface.get_size())
+
+    def _release_idle(self):
+        idle = [name for name in self.screens if name in self.factories and name != self.active_name]
+        idle.sort(key=lambda name: self._last_used.get(name, 0.0))
+        now = time.monotonic()
+        for name in idle:
+            too_many = self.max_resident is not None and len(self.screens) > self.max_resident
+            too_old = self.idle_timeout is not None and now - self._last_used.get(name, 0.0) >= self.idle_timeout
+            if too_many or too_old:
+                del self.screens[name]
+                # Screens share images (e.g. the mana bar), so keep any path a
+                # screen that stays resident still uses.
+                in_use = {path for other in self.screens for path in self.screen_assets.get(other, ())}
+                self.assets.discard(path for path in self.screen_assets.get(name, ()) if path not in in_use)
 
     def handle_event(self, event: pygame.event.Event):
         if self.active:
             self.active.handle_event(event)
 
     def update(self, timestamp: float):
-        if self.active:
+        if self.assets.pending:
+            self.assets.pump()
+        if not self.active:
+            return
+        if self.stats is None:
             self.active.update(timestamp)
-
-    def render(self, surface: pygame.Surface):
-        if self.active:
-            self.active.render(surface)
+            return
+        name = self.active_name
+        started = time.perf_counter()
+        self.active.update(timestamp)
+        self.stats.record(name, "update", time.perf_counter() - started)
+
+    def render(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        # Screens may return the rects they changed for pygame.display.update;
+        # None means the whole surface should be flipped.
+        if not self.active:
+            return None
+        if self.stats is None:
+            return self.active.render(surface)
+        started = time.perf_counter()
+        dirty = self.active.render(surface)
+        self.stats.record(self.active_name, "render", time.perf_counter() - started)
+        return dirty
+
+    def record(self, phase: str, seconds: float):
+        if self.stats is not None:
+            self.stats.record(self.active_name, phase, seconds)
 
     def quit(self):
         self.running = False
+        self.assets.shutdown()
+        if self.baker is not None:
+            self.baker.shutdown()
 
 
 class Screen:
+    # Image files the screen loads, for ``ScreenManager.add(..., assets=)``.
+    assets: tuple[str, ...] = ()
+
     def __init__(self, manager: ScreenManager):
         self.manager = manager
 
@@ -52,423 +179,198 @@ class Screen:
     def render(self, surface: pygame.Surface):
         pass
 
+    def upcoming(self) -> tuple[str, ...]:
+        """Names of the screens this one may switch to next, for preloading."""
+        return ()
+
 
 class CircleEffect:
+    # Opaque circle sprites shared by every effect, keyed by (radius, color) and
+    # evicted least recently used first. The fade is applied as surface alpha
+    # at blit time, which pygame combines with the per-pixel alpha, so drawing
+    # a frame allocates nothing.
+    sprite_cache_size = 32
+    _sprites: OrderedDict[tuple[int, tuple[int, int, int]], pygame.Surface] = OrderedDict()
+    # Cutscenes can be pre-rendered on a worker thread while another copy
+    # plays, and both share the sprites' surface alpha.
+    _sprite_lock = threading.Lock()
+
     def __init__(self, radius: int, color: tuple[int, int, int]):
         self.radius = radius
         self.color = color
 
-    def _draw_alpha_circle(self, surface: pygame.Surface, center: tuple[float, float], alpha: int):
-        diameter = self.radius * 2
-        circle_surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-        pygame.draw.circle(circle_surface, (*self.color, alpha), (self.radius, self.radius), self.radius)
-        surface.blit(circle_surface, (int(center[0]) - self.radius, int(center[1]) - self.radius))
-
-
-class YellowCircle(CircleEffect):
-    def __init__(self, radius: int, color: tuple[int, int, int], fade_duration: float):
-        super().__init__(radius, color)
-        self.fade_duration = fade_duration
-        self.center_x = 0.0
-        self.fading = False
-        self.fade_elapsed = 0.0
-        self.visible = True
-
-    def reset(self, center_x: float):
-        self.center_x = center_x
-        self.fading = False
-        self.fade_elapsed = 0.0
-        self.visible = True
-
-    def start_fade(self):
-        if not self.fading:
-            self.fading = True
-            self.fade_elapsed = 0.0
-
-    def update(self, timestamp: float):
-        if self.fading:
-            self.fade_elapsed += timestamp
-            if self.fade_elapsed >= self.fade_duration:
-                self.fade_elapsed = self.fade_duration
-                self.fading = False
-                self.visible = False
-
-    def render(self, surface: pygame.Surface, center_y: float):
-        if not self.visible and not self.fading:
-            return
-        if self.fading and self.fade_duration > 0:
-            ratio = max(0.0, 1.0 - (self.fade_elapsed / max(1e-6, self.fade_duration)))
-            alpha = int(255 * ratio)
+    @classmethod
+    def _sprite(cls, radius: int, color: tuple[int, int, int]) -> pygame.Surface:
+        key = (radius, tuple(color))
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, 255), (radius, radius), radius)
+            cls._sprites[key] = sprite
+            while len(cls._sprites) > cls.sprite_cache_size:
+                cls._sprites.popitem(last=False)
         else:
-            alpha = 255
-        self._draw_alpha_circle(surface, (self.center_x, center_y), alpha)
-
-
-class RedCircle(CircleEffect):
-    def __init__(self, radius: int, color: tuple[int, int, int], wait_time: float, move_duration: float, fade_in_delay: float = 1.0, fade_in_duration: float = 1.0):
-        super().__init__(radius, color)
-        self.wait_time = wait_time
-        self.move_duration = move_duration
-        self.fade_in_delay = fade_in_delay
-        self.fade_in_duration = fade_in_duration
-        self.start_x: float | None = None
-        self.target_x: float | None = None
-        self.current_x: float | None = None
-        self.wait_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.moving = False
-        self.finished = False
-        self.fade_wait_elapsed = 0.0
-        self.fade_in_elapsed = 0.0
-        self.fading_in = False
-        self.visible = False
-
-    def reset(self, start_x: float, target_x: float):
-        self.start_x = start_x
-        self.target_x = target_x
-        self.current_x = start_x
-        self.wait_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.moving = False
-        self.finished = False
-        self.fade_wait_elapsed = 0.0
-        self.fade_in_elapsed = 0.0
-        self.fading_in = False
-        self.visible = False
+            cls._sprites.move_to_end(key)
+        return sprite
 
-    def update(self, timestamp: float):
-        if self.finished:
-            return
-        if not self.visible:
-            if not self.fading_in:
-                self.fade_wait_elapsed += timestamp
-                if self.fade_wait_elapsed >= self.fade_in_delay:
-                    self.fading_in = True
-                    self.fade_in_elapsed = 0.0
-            else:
-                self.fade_in_elapsed += timestamp
-                if self.fade_in_elapsed >= self.fade_in_duration:
-                    self.fade_in_elapsed = self.fade_in_duration
-                    self.fading_in = False
-                    self.visible = True
+    def draw(self, surface: pygame.Surface, center: tuple[float, float], alpha: int):
+        if alpha <= 0:
             return
+        with self._sprite_lock:
+            sprite = self._sprite(self.radius, self.color)
+            sprite.set_alpha(min(alpha, 255))
+            surface.blit(sprite, (int(center[0]) - self.radius, int(center[1]) - self.radius))
 
-        if not self.moving:
-            self.wait_elapsed += timestamp
-            if self.wait_elapsed >= self.wait_time:
-                self.moving = True
-                self.move_elapsed = 0.0
-        else:
-            self.move_elapsed += timestamp
-            t = min(1.0, self.move_elapsed / max(1e-6, self.move_duration))
-            if self.start_x is not None and self.target_x is not None:
-                self.current_x = self.start_x + (self.target_x - self.start_x) * t
-            if t >= 1.0:
-                self.current_x = self.target_x
-                self.moving = False
-                self.finished = True
-
-    def render(self, surface: pygame.Surface, center_y: float):
-        if self.current_x is None:
-            return
-        if not self.visible and not self.fading_in:
-            return
-        if self.fading_in and self.fade_in_duration > 0:
-            alpha = int(255 * min(1.0, self.fade_in_elapsed / max(1e-6, self.fade_in_duration)))
-        else:
-            alpha = 255
-        self._draw_alpha_circle(surface, (self.current_x, center_y), alpha)
-
-
-class BlueCircle(CircleEffect):
-    def __init__(self, radius: int, color: tuple[int, int, int], wait_after_red: float, fade_duration: float, move_duration: float):
-        super().__init__(radius, color)
-        self.wait_after_red = wait_after_red
-        self.fade_duration = fade_duration
-        self.move_duration = move_duration
-        self.center_x: float | None = None
-        self.screen_width = 0
-        self.wait_elapsed = 0.0
-        self.fade_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.fading_in = False
-        self.fully_visible = False
-        self.moving = False
-        self.ready_for_sequence = False
-        self.finished = False
-        self.start_x = 0.0
-        self.target_x = 0.0
-
-    def reset(self, start_x: float, screen_width: int):
-        self.center_x = start_x
-        self.screen_width = screen_width
-        self.wait_elapsed = 0.0
-        self.fade_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.fading_in = False
-        self.fully_visible = False
-        self.moving = False
-        self.ready_for_sequence = False
-        self.finished = False
-        self.start_x = start_x
-        self.target_x = start_x
-
-    def notify_red_finished(self):
-        self.ready_for_sequence = True
 
-    def update(self, timestamp: float):
-        if not self.ready_for_sequence or self.center_x is None:
-            return
-        if not self.fading_in:
-            self.wait_elapsed += timestamp
-            if self.wait_elapsed >= self.wait_after_red:
-                self.fading_in = True
-                self.fade_elapsed = 0.0
-        elif not self.fully_visible:
-            self.fade_elapsed += timestamp
-            if self.fade_elapsed >= self.fade_duration:
-                self.fade_elapsed = self.fade_duration
-                self.fully_visible = True
-        elif not self.moving and not self.finished:
-            max_center_x = float(self.screen_width - self.radius) if self.screen_width else self.center_x
-            self.start_x = self.center_x
-            self.target_x = (self.start_x + max_center_x) / 2.0
-            self.move_elapsed = 0.0
-            self.moving = True
-        elif self.moving:
-            self.move_elapsed += timestamp
-            t = min(1.0, self.move_elapsed / max(1e-6, self.move_duration))
-            self.center_x = self.start_x + (self.target_x - self.start_x) * t
-            if t >= 1.0:
-                self.center_x = self.target_x
-                self.moving = False
-                self.finished = True
-
-    def render(self, surface: pygame.Surface, center_y: float):
-        if not self.ready_for_sequence or self.center_x is None:
-            return
-        if not self.fading_in and not self.fully_visible and not self.finished and not self.moving:
-            return
-        if self.fully_visible or self.finished or self.move_duration == 0:
-            alpha = 255
-        else:
-            alpha = int(255 * (self.fade_elapsed / max(1e-6, self.fade_duration)))
-        alpha = max(0, min(255, alpha))
-        self._draw_alpha_circle(surface, (self.center_x, center_y), alpha)
+class TimelineScreen(Screen):
+    """A screen whose whole state is its ``timeline`` at ``timeline.time``.
 
+    Subclasses lay the timeline out for the current surface size in
+    ``build_timeline``; it is rebuilt, at the same time position, when the
+    size changes. Because nothing else carries state between frames, any
+    moment can be shown directly with ``seek`` or ``render_at``. Players can
+    scrub with Left/Right, pause with Space and skip to the end with Return.
 
-class GreenCircle(CircleEffect):
-    def __init__(
-        self,
-        radius: int,
-        color: tuple[int, int, int],
-        wait_after_blue: float,
-        move_duration: float,
-        fade_duration: float,
-        corner_inset: tuple[float, float] = (-30.0, -20.0),
-        fade_in_duration: float = 0.5,
-    ):
-        super().__init__(radius, color)
-        self.wait_after_blue = wait_after_blue
-        self.move_duration = move_duration
-        self.fade_duration = fade_duration
-        self.corner_inset = corner_inset
-        self.fade_in_duration = fade_in_duration
-
-        self.wait_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.fade_in_elapsed = 0.0
-        self.fade_out_elapsed = 0.0
-        self.started = False
-        self.fading_in = False
-        self.moving = False
-        self.in_place = False
-        self.fading_out = False
-        self.finished = False
-        self.can_start_sequence = False
-        self.position: tuple[float, float] | None = None
-        self.start_pos: tuple[float, float] | None = None
-        self.target_pos: tuple[float, float] | None = None
-        self.corner_position: tuple[float, float] | None = None
-        self._trigger_fade_event = False
-        self.visible = False
-
-    def reset(self, yellow_x: float, center_y: float):
-        inset_x, inset_y = self.corner_inset
-        corner_x = self.radius + inset_x
-        corner_y = self.radius + inset_y
-
-        self.wait_elapsed = 0.0
-        self.move_elapsed = 0.0
-        self.fade_in_elapsed = 0.0
-        self.fade_out_elapsed = 0.0
-        self.started = False
-        self.fading_in = False
-        self.moving = False
-        self.in_place = False
-        self.fading_out = False
-        self.finished = False
-        self.can_start_sequence = False
-        self.position = None
-        self.start_pos = None
-        self.corner_position = (corner_x, corner_y)
-        self.target_pos = (yellow_x, center_y)
-        self._trigger_fade_event = False
-        self.visible = False
-
-    def notify_blue_finished(self):
-        self.can_start_sequence = True
-
-    def update(self, dt: float, yellow_x: float, center_y: float):
-        if self.finished or not self.can_start_sequence:
+    Subclasses draw in ``compose``; ``render`` blits a pre-baked frame
+    instead when the manager's baker has one for this exact definition and
+    size (see ``definition``).
+    """
+
+    scrub_step = 2.0
+
+    def __init__(self, manager: ScreenManager):
+        super().__init__(manager)
+        self.surface_width = 800
+        self.surface_height = 600
+        self.timeline = Timeline()
+        self.paused = False
+        self._timeline_size: tuple[int, int] | None = None
+        self._definition_key: str | None = None
+
+    def build_timeline(self) -> Timeline:
+        raise NotImplementedError
+
+    def compose(self, surface: pygame.Surface):
+        raise NotImplementedError
+
+    def definition(self) -> list:
+        """Everything that decides what the frames look like, as JSON-able data."""
+        return [
+            type(self).__qualname__,
+            [self.surface_width, self.surface_height],
+            [[track.name, track.times, track.values, [easing.__name__ for easing in track.easings]] for track in self.timeline.tracks],
+            self.timeline.event_times,
+        ]
+
+    def definition_key(self) -> str:
+        if self._definition_key is None:
+            data = json.dumps(self.definition(), separators=(",", ":")).encode()
+            self._definition_key = hashlib.sha1(data).hexdigest()[:16]
+        return self._definition_key
+
+    def _refresh_surface_metrics(self, surface: pygame.Surface | None = None):
+        surf = surface or pygame.display.get_surface()
+        if surf:
+            self.surface_width, self.surface_height = surf.get_size()
+        size = (self.surface_width, self.surface_height)
+        if size != self._timeline_size:
+            position = self.timeline.time
+            self.timeline = self.build_timeline()
+            self.timeline.seek(position)
+            self._timeline_size = size
+            self._definition_key = None
+
+    def on_enter(self):
+        self.paused = False
+        self.timeline.seek(0.0)
+        self._refresh_surface_metrics()
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type != pygame.KEYDOWN:
             return
+        if event.key == pygame.K_RIGHT:
+            self.scrub(self.scrub_step)
+        elif event.key == pygame.K_LEFT:
+            self.scrub(-self.scrub_step)
+        elif event.key == pygame.K_SPACE:
+            self.paused = not self.paused
+        elif event.key == pygame.K_RETURN:
+            self.skip()
 
-        self.target_pos = (yellow_x, center_y)
-
-        if not self.started:
-            self.wait_elapsed += dt
-            if self.wait_elapsed >= self.wait_after_blue:
-                self.started = True
-                self.position = self.corner_position
-                self.start_pos = self.corner_position
-                self.fading_in = True
-                self.visible = True
-                self.fade_in_elapsed = 0.0
-        elif self.fading_in:
-            if self.fade_in_duration <= 0:
-                self.fading_in = False
-                self.moving = True
-                self.move_elapsed = 0.0
-            else:
-                self.fade_in_elapsed += dt
-                if self.fade_in_elapsed >= self.fade_in_duration:
-                    self.fade_in_elapsed = self.fade_in_duration
-                    self.fading_in = False
-                    self.moving = True
-                    self.move_elapsed = 0.0
-        elif self.moving:
-            self.move_elapsed += dt
-            t = min(1.0, self.move_elapsed / max(1e-6, self.move_duration))
-            if self.start_pos and self.target_pos:
-                sx, sy = self.start_pos
-                tx, ty = self.target_pos
-                self.position = (sx + (tx - sx) * t, sy + (ty - sy) * t)
-            if t >= 1.0:
-                self.position = self.target_pos
-                self.moving = False
-                self.in_place = True
-                self.fading_out = True
-                self.fade_out_elapsed = 0.0
-                self._trigger_fade_event = True
-        elif self.fading_out:
-            self.fade_out_elapsed += dt
-            if self.fade_out_elapsed >= self.fade_duration:
-                self.fade_out_elapsed = self.fade_duration
-                self.fading_out = False
-                self.finished = True
-                self.visible = False
-
-    def consume_fade_trigger(self) -> bool:
-        if self._trigger_fade_event:
-            self._trigger_fade_event = False
-            return True
-        return False
+    def update(self, timestamp: float):
+        self._refresh_surface_metrics()
+        if not self.paused:
+            self.timeline.advance(timestamp)
+
+    def seek(self, t: float):
+        """Jump to ``t`` seconds in without firing the events in between."""
+        self.timeline.seek(min(max(0.0, t), self.timeline.duration))
+
+    def scrub(self, delta: float):
+        # Scrubbing forwards plays through any events it passes, so the
+        # hand-over at the end still happens; scrubbing back re-arms them.
+        if delta > 0:
+            self.timeline.advance(min(delta, max(0.0, self.timeline.duration - self.timeline.time)))
+        else:
+            self.seek(self.timeline.time + delta)
+
+    def skip(self):
+        self.scrub(self.timeline.duration - self.timeline.time)
 
     def render(self, surface: pygame.Surface):
-        if not self.started or self.position is None:
-            return
-        if not self.visible and not self.fading_in and not self.fading_out:
-            return
-        if self.fading_in and self.fade_in_duration > 0:
-            alpha = int(255 * min(1.0, self.fade_in_elapsed / max(1e-6, self.fade_in_duration)))
-        elif self.fading_out and self.fade_duration > 0:
-            alpha = int(255 * max(0.0, 1.0 - (self.fade_out_elapsed / max(1e-6, self.fade_duration))))
+        cache = self.manager.baker.get(self.manager.active_name) if self.manager.baker else None
+        if cache is not None and cache.size == surface.get_size() and cache.key == self.definition_key():
+            surface.blit(cache.surface_at(self.timeline.time), (0, 0))
         else:
-            alpha = 255
-        self._draw_alpha_circle(surface, self.position, alpha)
+            self.compose(surface)
 
+    def render_at(self, surface: pygame.Surface, t: float):
+        """Draw the frame at ``t`` seconds in, always composed live."""
+        self._refresh_surface_metrics(surface)
+        self.seek(t)
+        self.compose(surface)
 
-class CutScene1(Screen):
-    def __init__(self, manager: ScreenManager, font: pygame.font.Font):
+
+class ScriptedCutscene(TimelineScreen):
+    """A ``TimelineScreen`` played from a compiled cutscene script.
+
+    Each actor in the plan is a ``CircleEffect`` drawn, in script order, at
+    its track values; see ``cutscene_script`` for the script format.
+    """
+
+    def __init__(self, manager: ScreenManager, plan: CutscenePlan):
         super().__init__(manager)
-        self.font = font
-        self.surface_width = 800
-        self.surface_height = 600
-        self.center_x = self.surface_width / 2.0
-        self.center_y = self.surface_height / 2.0
+        self.plan = plan
+        self.actors = [(CircleEffect(actor.radius, actor.color), *actor.keys) for actor in plan.actors]
 
-        red_radius = 50
-        yellow_radius = 18
+    def build_timeline(self) -> Timeline:
+        return self.plan.build_timeline(self.surface_width, self.surface_height, self.manager.switch)
 
-        self.red_circle = RedCircle(red_radius, (255, 0, 0), wait_time=2.0, move_duration=3.0)
-        self.blue_circle = BlueCircle(red_radius, (50, 100, 255), wait_after_red=3.0, fade_duration=2.0, move_duration=3.0)
-        self.green_circle = GreenCircle(red_radius, (40, 200, 80), wait_after_blue=5.0, move_duration=1.0, fade_duration=1.0)
-        self.yellow_circle = YellowCircle(yellow_radius, (255, 215, 64), fade_duration=1.0)
+    def upcoming(self) -> tuple[str, ...]:
+        return tuple(target for _, target in self.plan.triggers)
 
-        self._blue_triggered = False
-        self._green_triggered = False
-        self._yellow_fade_complete = False
-        self._post_yellow_wait = 2.0
-        self._post_yellow_timer = 0.0
+    def definition(self) -> list:
+        circles = [[circle.radius, list(circle.color)] for circle, *_ in self.actors]
+        return super().definition() + [list(self.plan.background), circles]
 
-    def _refresh_surface_metrics(self):
-        surf = pygame.display.get_surface()
-        if surf:
-            self.surface_width, self.surface_height = surf.get_size()
-            self.center_x = self.surface_width / 2.0
-            self.center_y = self.surface_height / 2.0
+    def compose(self, surface: pygame.Surface):
+        surface.fill(self.plan.background)
+        values = self.timeline.values
+        for circle, x, y, alpha in self.actors:
+            circle.draw(surface, (values[x], values[y]), int(values[alpha]))
 
-    def on_enter(self):
-        self._refresh_surface_metrics()
-        start_x = self.center_x
-        min_center_x = float(self.red_circle.radius)
-        target_x = (start_x + min_center_x) / 2.0
 
-        self.red_circle.reset(start_x, target_x)
-        self.blue_circle.reset(start_x, self.surface_width)
-        self.green_circle.reset(start_x, self.center_y)
-        self.yellow_circle.reset(start_x)
+class CutScene1(ScriptedCutscene):
+    """Yellow is snatched: red, blue and green circles play out from ``cutscene1.json``."""
+
+    script_path = "cutscene1.json"
 
-        self._blue_triggered = False
-        self._green_triggered = False
-        self._yellow_fade_complete = False
-        self._post_yellow_timer = 0.0
+    def __init__(self, manager: ScreenManager, font: pygame.font.Font):
+        super().__init__(manager, load_plan(self.script_path))
+        self.font = font
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.manager.switch("MenuScreen")
-
-    def update(self, timestamp: float):
-        self._refresh_surface_metrics()
-        self.red_circle.update(timestamp)
-        self.blue_circle.update(timestamp)
-        self.green_circle.update(timestamp, self.yellow_circle.center_x, self.center_y)
-        self.yellow_circle.update(timestamp)
-
-        if self.red_circle.finished and not self._blue_triggered:
-            self.blue_circle.notify_red_finished()
-            self._blue_triggered = True
-
-        if self.blue_circle.finished and not self._green_triggered:
-            self.green_circle.notify_blue_finished()
-            self._green_triggered = True
-
-        if self.green_circle.consume_fade_trigger():
-            self.yellow_circle.start_fade()
-
-        if not self._yellow_fade_complete and not self.yellow_circle.visible and not self.yellow_circle.fading:
-            self._yellow_fade_complete = True
-            self._post_yellow_timer = 0.0
-        if self._yellow_fade_complete:
-            self._post_yellow_timer += timestamp
-            if self._post_yellow_timer >= self._post_yellow_wait:
-                self.manager.switch("TutorialTextScreen1")
-
-    def render(self, surface: pygame.Surface):
-        surface.fill((0, 0, 0))
-        center_y = self.center_y
-
-        self.yellow_circle.render(surface, center_y)
-        self.blue_circle.render(surface, center_y)
-        self.green_circle.render(surface)
-        self.red_circle.render(surface, center_y)
+            return
+        super().handle_event(event)
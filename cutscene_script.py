@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+import glob
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tomllib
+from types import CodeType
+from typing import Any
+
+from timeline import EASINGS, Keyframe, Timeline
+
+
+# A cutscene script (JSON, or TOML for ``.toml`` files) looks like:
+#
+#   marks:    {"red_visible": 2.0, "red_arrived": "red_visible + 5", ...}
+#   actors:   [{"name": "red", "radius": 50, "color": [255, 0, 0],
+#               "x": "center_x", "y": "center_y", "alpha": 0}, ...]
+#   tracks:   [{"actor": "red", "property": "x", "easing": "linear",
+#               "keys": [["red_arrived - 3", "center_x"], ["red_arrived", 25]]}, ...]
+#   triggers: [{"at": "faded + 2", "switch": "TutorialTextScreen1"}]
+#
+# Marks are evaluated in order and may refer to earlier ones; key times and
+# trigger times are numbers or expressions over marks. Actor defaults and key
+# values are numbers or expressions over the layout (width, height, center_x,
+# center_y) and the actor's radius, re-evaluated whenever the surface size
+# changes. Actors are drawn in the order listed.
+
+PLAN_FORMAT = 1
+PROPERTIES = ("x", "y", "alpha")
+LAYOUT_NAMES = frozenset({"width", "height", "center_x", "center_y", "radius"})
+# The surface size ``TimelineScreen`` starts with; layout expressions are
+# checked at it when a script is compiled.
+DEFAULT_SIZE = (800, 600)
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.USub,
+    ast.UAdd,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+)
+
+
+class ScriptError(ValueError):
+    pass
+
+
+Value = float | CodeType
+
+
+@dataclass
+class ActorPlan:
+    name: str
+    radius: int
+    color: tuple[int, int, int]
+    # Names of this actor's x, y and alpha entries in ``Timeline.values``.
+    keys: tuple[str, str, str]
+
+
+@dataclass
+class TrackPlan:
+    name: str
+    actor: int
+    times: list[float]
+    values: list[Value]
+    easings: list[str]
+
+
+@dataclass
+class CutscenePlan:
+    """A validated script flattened into per-track arrays of resolved times.
+
+    Only the layout-dependent values are left as compiled expressions; they
+    are evaluated by ``build_timeline`` for a given surface size.
+    """
+
+    background: tuple[int, int, int]
+    actors: list[ActorPlan]
+    tracks: list[TrackPlan]
+    triggers: list[tuple[float, str]]
+
+    def build_timeline(self, width: int, height: int, switch) -> Timeline:
+        layout = {"width": width, "height": height, "center_x": width / 2.0, "center_y": height / 2.0}
+        timeline = Timeline()
+        for track in self.tracks:
+            names = dict(layout, radius=self.actors[track.actor].radius)
+            keyframes = [
+                Keyframe(time, _evaluate(value, names), easing)
+                for time, value, easing in zip(track.times, track.values, track.easings)
+            ]
+            timeline.add_track(track.name, *keyframes)
+        for time, target in self.triggers:
+            timeline.add_event(time, lambda target=target: switch(target))
+        return timeline
+
+    def to_data(self) -> tuple:
+        return (
+            self.background,
+            [(actor.name, actor.radius, actor.color, actor.keys) for actor in self.actors],
+            [(track.name, track.actor, track.times, track.values, track.easings) for track in self.tracks],
+            self.triggers,
+        )
+
+    @classmethod
+    def from_data(cls, data: tuple) -> "CutscenePlan":
+        background, actors, tracks, triggers = data
+        return cls(
+            tuple(background),
+            [ActorPlan(name, radius, tuple(color), tuple(keys)) for name, radius, color, keys in actors],
+            [TrackPlan(*track) for track in tracks],
+            [tuple(trigger) for trigger in triggers],
+        )
+
+
+def _evaluate(value: Value, names: dict[str, float]) -> float:
+    if isinstance(value, CodeType):
+        try:
+            return float(eval(value, {"__builtins__": {}}, names))
+        except ArithmeticError as exc:
+            # Expressions are compiled with their script location as the
+            # file name, so the error can still point at it.
+            raise ScriptError(f"{value.co_filename}: {exc}") from None
+    return value
+
+
+def _expression(source: Any, allowed: frozenset[str] | set[str], where: str) -> Value:
+    """A number as a float, or an arithmetic expression over ``allowed`` compiled once."""
+    if isinstance(source, bool) or not isinstance(source, (int, float, str)):
+        raise ScriptError(f"{where}: expected a number or expression, not {source!r}")
+    if not isinstance(source, str):
+        return float(source)
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as exc:
+        raise ScriptError(f"{where}: {exc.msg} in {source!r}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ScriptError(f"{where}: {type(node).__name__} is not allowed in {source!r}")
+        if isinstance(node, ast.Name) and node.id not in allowed:
+            raise ScriptError(f"{where}: unknown name {node.id!r} in {source!r}")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            raise ScriptError(f"{where}: only numbers are allowed in {source!r}")
+    code = compile(tree, where, "eval")
+    if not any(isinstance(node, ast.Name) for node in ast.walk(tree)):
+        return _evaluate(code, {})
+    return code
+
+
+def _color(value: Any, where: str) -> tuple[int, int, int]:
+    if not (isinstance(value, list) and len(value) == 3 and all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+        raise ScriptError(f"{where}: color must be three integers 0-255, not {value!r}")
+    return tuple(value)
+
+
+def compile_script(script: dict) -> CutscenePlan:
+    """Validate a parsed script and flatten it into a ``CutscenePlan``."""
+    if not isinstance(script, dict):
+        raise ScriptError("script must be an object")
+    unknown = set(script) - {"background", "marks", "actors", "tracks", "triggers"}
+    if unknown:
+        raise ScriptError(f"unknown top-level keys: {sorted(unknown)}")
+
+    for section, kind in (("marks", dict), ("actors", list), ("tracks", list), ("triggers", list)):
+        if not isinstance(script.get(section, kind()), kind):
+            raise ScriptError(f"{section} must be a{'n object' if kind is dict else ' list'}")
+
+    marks: dict[str, float] = {}
+    for name, source in script.get("marks", {}).items():
+        marks[name] = _evaluate(_expression(source, set(marks), f"marks.{name}"), marks)
+
+    actors: list[ActorPlan] = []
+    index: dict[str, int] = {}
+    defaults: list[dict[str, Value]] = []
+    for position, actor in enumerate(script.get("actors", [])):
+        where = f"actors[{position}]"
+        if not isinstance(actor, dict):
+            raise ScriptError(f"{where}: expected an object")
+        name = actor.get("name")
+        if not isinstance(name, str) or name in index:
+            raise ScriptError(f"{where}: actors need a unique name")
+        radius = actor.get("radius")
+        if isinstance(radius, bool) or not isinstance(radius, int) or radius <= 0:
+            raise ScriptError(f"{where}: radius must be a positive integer")
+        index[name] = position
+        actors.append(ActorPlan(name, radius, _color(actor.get("color"), where), tuple(f"{name}.{p}" for p in PROPERTIES)))
+        defaults.append({p: _expression(actor.get(p, 255 if p == "alpha" else 0), LAYOUT_NAMES, f"{where}.{p}") for p in PROPERTIES})
+
+    tracks: dict[str, TrackPlan] = {}
+    for position, track in enumerate(script.get("tracks", [])):
+        where = f"tracks[{position}]"
+        if not isinstance(track, dict):
+            raise ScriptError(f"{where}: expected an object")
+        actor = track.get("actor")
+        prop = track.get("property")
+        if actor not in index:
+            raise ScriptError(f"{where}: unknown actor {actor!r}")
+        if prop not in PROPERTIES:
+            raise ScriptError(f"{where}: property must be one of {PROPERTIES}")
+        name = f"{actor}.{prop}"
+        if name in tracks:
+            raise ScriptError(f"{where}: {name} already has a track")
+        default_easing = track.get("easing", "linear")
+        keys = []
+        for number, key in enumerate(track.get("keys") or []):
+            if not isinstance(key, list) or len(key) not in (2, 3):
+                raise ScriptError(f"{where}.keys[{number}]: expected [time, value] or [time, value, easing]")
+            easing = key[2] if len(key) == 3 else default_easing
+            if easing not in EASINGS:
+                raise ScriptError(f"{where}.keys[{number}]: unknown easing {easing!r}")
+            time = _evaluate(_expression(key[0], set(marks), f"{where}.keys[{number}]"), marks)
+            keys.append((time, _expression(key[1], LAYOUT_NAMES, f"{where}.keys[{number}]"), easing))
+        if not keys:
+            raise ScriptError(f"{where}: a track needs at least one key")
+        keys.sort(key=lambda key: key[0])
+        tracks[name] = TrackPlan(name, index[actor], [k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys])
+
+    # Properties without a track hold their default, so every actor reads
+    # the same three values and drawing never has to check.
+    for position, actor in enumerate(actors):
+        for prop, key in zip(PROPERTIES, actor.keys):
+            if key not in tracks:
+                tracks[key] = TrackPlan(key, position, [0.0], [defaults[position][prop]], ["linear"])
+
+    triggers = []
+    for position, trigger in enumerate(script.get("triggers", [])):
+        where = f"triggers[{position}]"
+        if not isinstance(trigger, dict):
+            raise ScriptError(f"{where}: expected an object")
+        target = trigger.get("switch")
+        if not isinstance(target, str):
+            raise ScriptError(f"{where}: triggers need a 'switch' screen name")
+        triggers.append((_evaluate(_expression(trigger.get("at"), set(marks), where), marks), target))
+    triggers.sort()
+
+    background = _color(script.get("background", [0, 0, 0]), "background")
+    plan = CutscenePlan(background, actors, list(tracks.values()), triggers)
+    # Layout expressions only run once a screen knows its size; trying them
+    # at the default size catches e.g. a division by zero up front.
+    plan.build_timeline(*DEFAULT_SIZE, lambda target: None)
+    return plan
+
+
+def _parse(path: str, source: bytes) -> dict:
+    try:
+        if path.endswith(".toml"):
+            return tomllib.loads(source.decode())
+        return json.loads(source)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ScriptError(f"{path}: {exc}") from None
+
+
+def load_plan(path: str, cache_dir: str | None = None) -> CutscenePlan:
+    """Compile the script at ``path``, reusing a cached plan when the script is unchanged.
+
+    Plans are cached, marshalled like ``.pyc`` files, in ``cache_dir``
+    (default: ``__pycache__`` next to the script) under a hash of the script,
+    the plan format and the interpreter.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha1(source + f"|{PLAN_FORMAT}|{sys.implementation.cache_tag}".encode()).hexdigest()[:16]
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), "__pycache__")
+    cached = os.path.join(cache_dir, f"{os.path.basename(path)}.{digest}.plan")
+    try:
+        with open(cached, "rb") as f:
+            return CutscenePlan.from_data(marshal.load(f))
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    plan = compile_script(_parse(path, source))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(glob.escape(cache_dir), f"{glob.escape(os.path.basename(path))}.*.plan")):
+            os.remove(stale)
+        with open(cached + ".tmp", "wb") as f:
+            marshal.dump(plan.to_data(), f)
+        os.replace(cached + ".tmp", cached)
+    except OSError:
+        pass
+    return plan
+
+
+__all__ = ["CutscenePlan", "ScriptError", "compile_script", "load_plan"]
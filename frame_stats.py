@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import deque
+import csv
+import json
+import math
+
+
+PHASES = ("event", "update", "render", "flip")
+PERCENTILES = (50, 95, 99)
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def _row_order(key: tuple[str, str]) -> tuple:
+    screen, phase = key
+    return screen, PHASES.index(phase) if phase in PHASES else len(PHASES), phase
+
+
+class FrameStats:
+    """Rolling per-screen timings of each phase of a frame.
+
+    Every ``(screen, phase)`` pair keeps its last ``window`` samples, in
+    seconds; percentiles are only worked out when a summary is asked for, so
+    recording is a deque append.
+    """
+
+    def __init__(self, window: int = 600):
+        self.window = window
+        self.samples: dict[tuple[str, str], deque[float]] = {}
+
+    def record(self, screen: str | None, phase: str, seconds: float) -> None:
+        key = (screen or "-", phase)
+        samples = self.samples.get(key)
+        if samples is None:
+            samples = self.samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def summary(self) -> list[dict]:
+        """One row per screen and phase, with times in milliseconds."""
+        rows = []
+        for screen, phase in sorted(self.samples, key=_row_order):
+            ordered = sorted(self.samples[screen, phase])
+            row = {"screen": screen, "phase": phase, "frames": len(ordered), "mean_ms": sum(ordered) / len(ordered) * 1000}
+            for pct in PERCENTILES:
+                row[f"p{pct}_ms"] = _percentile(ordered, pct) * 1000
+            rows.append(row)
+        return rows
+
+    def dump(self, path: str) -> None:
+        """Write the summary as JSON if ``path`` ends in ``.json``, else as CSV."""
+        rows = self.summary()
+        with open(path, "w", newline="") as f:
+            if path.endswith(".json"):
+                json.dump(rows, f, indent=2)
+                return
+            fields = ["screen", "phase", "frames", "mean_ms"] + [f"p{pct}_ms" for pct in PERCENTILES]
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+__all__ = ["FrameStats", "PHASES"]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Iterable
+
+# Must be set before pygame initialises its display.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from cutscene import ScreenManager, TimelineScreen
+from frame_stats import FrameStats
+import mellow_yellow
+import Yellow
+
+
+# Scripted input: frame number -> events posted to the screen before that frame.
+Script = dict[int, list[pygame.event.Event]]
+
+
+def init(size: tuple[int, int] = (800, 600)) -> pygame.font.Font:
+    """Open an offscreen display (screens convert images against it) and return the game font."""
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(size)
+    return pygame.font.Font(None, 36)
+
+
+def build_manager(font: pygame.font.Font) -> ScreenManager:
+    """A manager with the screens of both games registered under their usual names."""
+    manager = ScreenManager()
+    Yellow.register_screens(manager, font)
+    mellow_yellow.register_screens(manager, font)
+    return manager
+
+
+def parse_keys(specs: Iterable[str]) -> Script:
+    """Turn ``"FRAME:KEY"`` strings (e.g. ``"30:right"``) into a script of key presses."""
+    script: Script = {}
+    for spec in specs:
+        frame, _, name = spec.partition(":")
+        key = pygame.key.key_code(name)
+        script.setdefault(int(frame), []).append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+    return script
+
+
+def run_screen(
+    manager: ScreenManager,
+    name: str,
+    frames: int,
+    size: tuple[int, int] = (800, 600),
+    script: Script | None = None,
+    dt: float = 1 / 60,
+) -> dict:
+    """Drive screen ``name`` for ``frames`` frames as fast as possible.
+
+    Every frame advances the game by ``dt`` regardless of how long it took,
+    so runs are repeatable, and renders into an offscreen surface. If the
+    screen switches away, the run carries on with whichever screen is active.
+    Returns the frame rate and the ``FrameStats`` summary.
+    """
+    script = script or {}
+    surface = pygame.Surface(size)
+    manager.stats = FrameStats(window=max(frames, 1))
+    manager.switch(name)
+    started = time.perf_counter()
+    for frame in range(frames):
+        events = script.get(frame)
+        if events:
+            event_started = time.perf_counter()
+            for event in events:
+                manager.handle_event(event)
+            manager.record("event", time.perf_counter() - event_started)
+        manager.update(dt)
+        manager.render(surface)
+    elapsed = time.perf_counter() - started
+    return {
+        "screen": name,
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / max(elapsed, 1e-9),
+        "phases": manager.stats.summary(),
+    }
+
+
+def render_at(manager: ScreenManager, name: str, t: float, size: tuple[int, int] = (800, 600)) -> pygame.Surface:
+    """Screen ``name``, which must be a ``TimelineScreen``, as it looks ``t`` seconds in.
+
+    The frame is rendered directly rather than by playing up to it, so tests
+    can check any moment of a cutscene cheaply.
+    """
+    screen = manager.get(name)
+    if not isinstance(screen, TimelineScreen):
+        raise TypeError(f"{name!r} is not a TimelineScreen")
+    surface = pygame.Surface(size)
+    screen.render_at(surface, t)
+    return surface
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run screens offscreen at an unthrottled frame rate.")
+    parser.add_argument("screens", nargs="*", help="screen names (default: every registered screen)")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--size", default="800x600")
+    parser.add_argument("--keys", nargs="*", default=[], metavar="FRAME:KEY", help="key presses, e.g. 30:right 45:up")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--list", action="store_true", help="list the registered screens and exit")
+    args = parser.parse_args(argv)
+
+    size = tuple(int(part) for part in args.size.split("x"))
+    font = init(size)
+    manager = build_manager(font)
+    names = sorted(manager.screens.keys() | manager.factories.keys())
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = []
+    for name in args.screens or names:
+        result = run_screen(manager, name, args.frames, size, parse_keys(args.keys))
+        results.append(result)
+        print(f"{name:22s} {result['fps']:9.0f} fps")
+        for row in result["phases"]:
+            print(f"  {row['screen']:20s} {row['phase']:7s} mean {row['mean_ms']:7.3f} ms  p95 {row['p95_ms']:7.3f} ms  p99 {row['p99_ms']:7.3f} ms")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    manager.quit()
+    pygame.quit()
+    return 0
+
+
+__all__ = ["build_manager", "init", "parse_keys", "render_at", "run_screen"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
+import os
 import sys
+import time
 
 import pygame
 
 from cutscene import Screen, ScreenManager
+from frame_stats import FrameStats
 from snake import SnakeScreen
 
 
@@ -312,6 +315,17 @@ class EndScreen(Screen):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
             self.manager.switch("game")
 
+
+def register_screens(manager: ScreenManager, font: pygame.font.Font):
+    manager.add("title", lambda: TitleScreen(manager, font))
+    manager.add("menu", lambda: MenuScreen(manager, font))
+    # Built eagerly so it is never released: it keeps its state between visits.
+    manager.add("game", GameScreen(manager, font))
+    manager.add("snake", lambda: SnakeScreen(manager, font))
+    manager.add("credits", lambda: CreditsScreen(manager, font))
+    manager.add("end", lambda: EndScreen(manager, font))
+
+
 def main():
     pygame.init()
     size = (800, 600)
@@ -320,27 +334,39 @@ def main():
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, 36)
 
-    manager = ScreenManager()
-    manager.add("title", TitleScreen(manager, font))
-    manager.add("menu", MenuScreen(manager, font))
-    manager.add("game", GameScreen(manager, font))
-    manager.add("snake", SnakeScreen(manager, font))
-    manager.add("credits", CreditsScreen(manager, font))
-    manager.add("end", EndScreen(manager, font))
+    manager = ScreenManager(idle_timeout=60.0)
+    register_screens(manager, font)
     manager.switch("title")
 
+    # YELLOW_PROFILE=frames.csv (or .json) records per-screen frame timings,
+    # written there on exit and whenever F12 is pressed.
+    profile_path = os.environ.get("YELLOW_PROFILE")
+    if profile_path:
+        manager.stats = FrameStats()
+
     while manager.running:
         dt = clock.tick(60) / 1000.0
+        started = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 manager.quit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12 and manager.stats:
+                manager.stats.dump(profile_path)
             else:
                 manager.handle_event(event)
+        manager.record("event", time.perf_counter() - started)
 
         manager.update(dt)
-        manager.render(screen)
-        pygame.display.flip()
-
+        dirty = manager.render(screen)
+        started = time.perf_counter()
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        manager.record("flip", time.perf_counter() - started)
+
+    if manager.stats:
+        manager.stats.dump(profile_path)
     pygame.quit()
     sys.exit()
 
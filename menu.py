@@ -12,6 +12,10 @@ class TitleScreen(Screen):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
             self.manager.switch("MenuScreen")
 
+    def upcoming(self) -> tuple[str, ...]:
+        # The cutscene is only one screen further, and baking it takes a while.
+        return ("MenuScreen", "CutScene1")
+
     def render(self, surface: pygame.Surface):
         extremely_dark_blue = (0, 10, 47)
         background_color = pygame.Color(extremely_dark_blue)
@@ -44,6 +48,9 @@ class MenuScreen(Screen):
                 else:
                     self.manager.quit()
 
+    def upcoming(self) -> tuple[str, ...]:
+        return ("CutScene1",)
+
     def render(self, surface):
         selected_option_color = (255, 255, 100)
         default_option_color = (200, 200, 200)
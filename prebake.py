@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import glob
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Callable
+
+import pygame
+
+from cutscene import TimelineScreen
+
+
+# Frame cache file: magic, key length, width, height, fps and frame count,
+# then the key and one length-prefixed zlib-compressed RGB frame per entry.
+_MAGIC = b"YFC1"
+_HEADER = struct.Struct("<4sHHHfI")
+_LENGTH = struct.Struct("<I")
+
+
+class FrameCache:
+    """A cutscene pre-rendered at ``fps`` into zlib-compressed RGB frames.
+
+    ``key`` identifies the screen definition and surface size the frames
+    were rendered from (see ``TimelineScreen.definition_key``); a cache whose
+    key does not match the screen's current one is stale.
+
+    Frames stay compressed in memory. During playback ``surface_at`` keeps
+    the next ``window`` frames decoded on a worker thread into surfaces in
+    the display's pixel format, so showing a frame is a single plain blit;
+    only the first frame after a seek is decoded on the spot.
+    """
+
+    def __init__(self, key: str, size: tuple[int, int], fps: float, frames: list[bytes], window: int = 8):
+        self.key = key
+        self.size = size
+        self.fps = fps
+        self.frames = frames
+        self.window = window
+        self._shown_index = -1
+        self._shown: pygame.Surface | None = None
+        self._format: pygame.Surface | None = None
+        self._decoded: dict[int, Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def surface_at(self, t: float) -> pygame.Surface:
+        index = min(len(self.frames) - 1, max(0, int(t * self.fps)))
+        if index != self._shown_index:
+            if self._format is None:
+                # Converting against a template rather than the display itself
+                # keeps the worker away from the video subsystem.
+                display = pygame.display.get_surface()
+                self._format = pygame.Surface((1, 1), 0, display) if display is not None else pygame.Surface((1, 1))
+            future = self._decoded.pop(index, None)
+            self._shown = future.result() if future is not None else self._decode(index)
+            self._shown_index = index
+            self._decode_ahead(index)
+        return self._shown
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._decoded.clear()
+
+    def _decode_ahead(self, index: int) -> None:
+        wanted = range(index + 1, min(len(self.frames), index + 1 + self.window))
+        for stale in [ahead for ahead in self._decoded if ahead not in wanted]:
+            self._decoded.pop(stale).cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frames")
+        for ahead in wanted:
+            if ahead not in self._decoded:
+                self._decoded[ahead] = self._executor.submit(self._decode, ahead)
+
+    def _decode(self, index: int) -> pygame.Surface:
+        frame = pygame.image.frombytes(zlib.decompress(self.frames[index]), self.size, "RGB")
+        return frame.convert(self._format)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(frame) for frame in self.frames)
+
+    def save(self, path: str) -> None:
+        key = self.key.encode()
+        with open(path + ".tmp", "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(key), self.size[0], self.size[1], self.fps, len(self.frames)))
+            f.write(key)
+            for frame in self.frames:
+                f.write(_LENGTH.pack(len(frame)))
+                f.write(frame)
+        os.replace(path + ".tmp", path)
+
+    def check(self) -> None:
+        """Decompress every frame, raising ``zlib.error`` or ValueError if one is damaged."""
+        expected = self.size[0] * self.size[1] * 3
+        for index, frame in enumerate(self.frames):
+            if len(zlib.decompress(frame)) != expected:
+                raise ValueError(f"frame {index} does not hold a {self.size[0]}x{self.size[1]} RGB image")
+
+    @classmethod
+    def load(cls, path: str) -> "FrameCache":
+        with open(path, "rb") as f:
+            magic, key_length, width, height, fps, count = _HEADER.unpack(_read(f, _HEADER.size, path))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a frame cache")
+            key = _read(f, key_length, path).decode()
+            frames = []
+            for _ in range(count):
+                (length,) = _LENGTH.unpack(_read(f, _LENGTH.size, path))
+                frames.append(_read(f, length, path))
+            if f.read(1):
+                raise ValueError(f"{path} has data after its last frame")
+        return cls(key, (width, height), fps, frames)
+
+
+def _read(f: BinaryIO, size: int, path: str) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError(f"{path} is truncated")
+    return data
+
+
+def bake(
+    screen: TimelineScreen,
+    size: tuple[int, int],
+    fps: float = 30.0,
+    cancelled: threading.Event | None = None,
+) -> FrameCache | None:
+    """Render every frame of ``screen``'s timeline; None if ``cancelled`` gets set."""
+    surface = pygame.Surface(size)
+    screen.render_at(surface, 0.0)
+    key = screen.definition_key()
+    count = int(screen.timeline.duration * fps) + 1
+    frames = []
+    for index in range(count):
+        if cancelled is not None and cancelled.is_set():
+            return None
+        screen.render_at(surface, index / fps)
+        frames.append(zlib.compress(pygame.image.tobytes(surface, "RGB"), 1))
+        # Let the main thread in between frames so the menu stays smooth.
+        time.sleep(0)
+    return FrameCache(key, size, fps, frames)
+
+
+class FrameBaker:
+    """Bakes ``FrameCache``s for timeline screens on background threads.
+
+    ``request`` builds a private instance of the screen from its factory, so
+    baking never touches the one being played, and bakes it unless a cache
+    with the same key is already in memory or, when ``cache_dir`` is set, on
+    disk. ``get`` returns a finished cache or None.
+    """
+
+    def __init__(self, cache_dir: str | None = None, fps: float = 30.0):
+        self.cache_dir = cache_dir
+        self.fps = fps
+        self._caches: dict[str, FrameCache] = {}
+        self._threads: dict[str, threading.Thread] = {}
+        self._cancelled = threading.Event()
+
+    def request(self, name: str, factory: Callable[[], TimelineScreen], size: tuple[int, int]) -> None:
+        thread = self._threads.get(name)
+        if thread is not None and thread.is_alive():
+            return
+        screen = factory()
+        screen.render_at(pygame.Surface(size), 0.0)
+        key = screen.definition_key()
+        cache = self._caches.get(name)
+        if cache is not None and cache.key == key:
+            return
+        thread = threading.Thread(target=self._build, args=(name, screen, size, key), name=f"bake-{name}", daemon=True)
+        self._threads[name] = thread
+        thread.start()
+
+    def get(self, name: str) -> FrameCache | None:
+        return self._caches.get(name)
+
+    def wait(self, name: str, timeout: float | None = None) -> FrameCache | None:
+        thread = self._threads.get(name)
+        if thread is not None:
+            thread.join(timeout)
+        return self._caches.get(name)
+
+    def shutdown(self) -> None:
+        self._cancelled.set()
+        for cache in self._caches.values():
+            cache.close()
+
+    def _store(self, name: str, cache: FrameCache) -> None:
+        previous = self._caches.get(name)
+        self._caches[name] = cache
+        if previous is not None:
+            previous.close()
+
+    def _path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}-{key}.frames")
+
+    def _build(self, name: str, screen: TimelineScreen, size: tuple[int, int], key: str) -> None:
+        if self.cache_dir is not None:
+            path = self._path(name, key)
+            if os.path.exists(path):
+                # A damaged file is rebaked here rather than failing mid-cutscene
+                # on the main thread, so every frame is decompressed once first.
+                try:
+                    cache = FrameCache.load(path)
+                    cache.check()
+                    self._store(name, cache)
+                    return
+                except (OSError, ValueError, zlib.error):
+                    pass
+        cache = bake(screen, size, self.fps, self._cancelled)
+        if cache is None:
+            return
+        self._store(name, cache)
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{glob.escape(name)}-*.frames")):
+                os.remove(stale)
+            cache.save(self._path(name, key))
+
+
+__all__ = ["FrameBaker", "FrameCache", "bake"]
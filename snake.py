@@ -1,26 +1,77 @@
 from __future__ import annotations
 
 import random
+import time
+from typing import Callable, Iterable
 
 import pygame
 
+try:
+    import numpy as np
+except ImportError:  # bulk rendering is optional; the per-cell path needs nothing extra
+    np = None
+
 from cutscene import Screen, ScreenManager
-from snake_logic import SnakeGame
+from snake_autopilot import Autopilot
+from snake_bots import arena_greedy_policy
+from snake_logic import Direction, SnakeArena, SnakeGame, TurnQueue
+from snake_replay import ReplayWriter
+from timestep import FixedTimestep
 
 
 class SnakeScreen(Screen):
+    """Plays Snake, or the multi-snake arena with ``M``.
+
+    Every single-snake game gets its own seed, drawn from ``rng``. Set
+    ``recorder`` to a ``(seed, grid_width, grid_height) -> ReplayWriter``
+    factory to record each game for ``snake_replay``: it is called when a
+    game starts and given every direction the screen applies.
+    """
+
     def __init__(self, manager: ScreenManager, font: pygame.font.Font):
         super().__init__(manager)
         self.font = font
         self.cell_size = 24
         self.top_padding = 60
         self.tick_interval = 0.12
-        self.accumulator = 0.0
+        self.history_ticks = 600
+        self.history_bytes = 1 << 20
+        self.timestep = FixedTimestep(self.tick_interval, max_steps=3)
+        self.interpolate = True
         self.game: SnakeGame | None = None
-        self.queued_direction: tuple[int, int] | None = None
+        self.turns = TurnQueue()
         self.paused = False
         self.rng = random.Random(7)
+        self.seed: int | None = None
+        self.tick = 0
+        self.recorder: Callable[[int, int, int], ReplayWriter] | None = None
+        self.replay: ReplayWriter | None = None
         self.last_surface_size: tuple[int, int] | None = None
+        self.autopilot: Autopilot | None = None
+        self.arena: SnakeArena | None = None
+        self.arena_mode = False
+        self.arena_bots = 11
+        self.bot_colors = [(200, 160, 70), (110, 150, 230), (200, 100, 200), (90, 200, 210), (230, 130, 90)]
+        self.background_color = (12, 16, 18)
+        self.board_color = (30, 34, 38)
+        self.body_color = (90, 200, 120)
+        self.head_color = (130, 240, 160)
+        self.food_color = (220, 80, 60)
+        self.incremental = True
+        self._full_redraw = True
+        self._dirty_cells: set[tuple[int, int]] = set()
+        self._drawn_state: tuple | None = None
+        self._drawn_hud: tuple | None = None
+        self._prev_tail: tuple[int, int] | None = None
+        self._motion_drawn: set[tuple[int, int]] = set()
+        self._board_layer: pygame.Surface | None = None
+        self._board_layer_key: tuple | None = None
+        self._text_cache: dict[str, tuple[tuple[str, tuple[int, int, int]], pygame.Surface]] = {}
+        self.bulk_render_max_cell = 6
+        self._grid_pixels = None
+        self._palette = None
+        self._grid_surface: pygame.Surface | None = None
+        self._scaled_grid: pygame.Surface | None = None
 
     def on_enter(self):
         self._reset_game()
@@ -32,11 +83,33 @@ class SnakeScreen(Screen):
             self.manager.switch("menu")
             return
         if event.key in (pygame.K_r, pygame.K_RETURN):
-            if self.game and not self.game.alive:
+            if self._has_session() and not self._player_alive():
                 self._reset_game()
             return
+        if event.key == pygame.K_m:
+            self.arena_mode = not self.arena_mode
+            self.autopilot = None
+            self._reset_game()
+            return
+        if event.key == pygame.K_TAB and not self.arena_mode:
+            self.autopilot = None if self.autopilot else Autopilot()
+            if self.autopilot and self.game:
+                self.autopilot.prepare(self.game.grid_width, self.game.grid_height)
+            return
+        if event.key in (pygame.K_BACKSPACE, pygame.K_z):
+            undone = self.game.rewind() if self.game else 0
+            if undone:
+                self.tick -= undone
+                # A replay is one linear run of inputs, so the recording
+                # cannot follow the game back in time; it ends here.
+                self._stop_recording()
+                self.timestep.reset()
+                self.turns.clear()
+                self._prev_tail = None
+                self._full_redraw = True
+            return
         if event.key in (pygame.K_SPACE, pygame.K_p):
-            if self.game and self.game.alive:
+            if self._has_session() and self._player_alive():
                 self.paused = not self.paused
             return
 
@@ -49,59 +122,279 @@ class SnakeScreen(Screen):
             direction = (-1, 0)
         elif event.key in (pygame.K_RIGHT, pygame.K_d):
             direction = (1, 0)
-        if direction is not None:
-            self.queued_direction = direction
+        if direction is not None and self._has_session():
+            current = self.arena.snakes[0].direction if self.arena else self.game.direction
+            self.turns.push(direction, current, time.perf_counter())
 
     def update(self, dt: float):
+        if self.arena:
+            self._update_arena(dt)
+            return
+        if self.autopilot and self.game and not self.game.alive:
+            self._start_game(self.game.grid_width, self.game.grid_height)
+            self._full_redraw = True
         if not self.game or self.paused or not self.game.alive:
             return
-        self.accumulator += dt
-        while self.accumulator >= self.tick_interval:
-            if self.queued_direction is not None:
-                self.game.set_direction(self.queued_direction)
-                self.queued_direction = None
-            self.game.step()
-            self.accumulator -= self.tick_interval
+        for _ in range(self.timestep.advance(dt)):
+            if self.autopilot:
+                self._set_direction(self.autopilot.choose(self.game))
+            else:
+                turn = self.turns.pop(self.game.direction, time.perf_counter())
+                if turn is not None:
+                    self._set_direction(turn)
+            self._step_game()
 
-    def render(self, surface: pygame.Surface):
-        self._ensure_game(surface)
-        if not self.game:
+    def _set_direction(self, direction: Direction):
+        self.game.set_direction(direction)
+        if self.replay is not None:
+            self.replay.record(self.tick, direction)
+
+    def _step_game(self):
+        # Every tick changes at most the old and new head, the tail and the
+        # food cell; remember them so render() can repaint just those.
+        game = self.game
+        head = game.snake[0]
+        tail = game.snake[-1]
+        food = game.food
+        game.step()
+        self.tick += 1
+        if not game.alive:
+            return
+        self._dirty_cells.add(head)
+        self._dirty_cells.add(game.snake[0])
+        if game.snake[-1] != tail:
+            self._dirty_cells.add(tail)
+            self._prev_tail = tail
+        else:
+            self._prev_tail = None
+        if game.food != food:
+            if food is not None:
+                self._dirty_cells.add(food)
+            if game.food is not None:
+                self._dirty_cells.add(game.food)
+
+    def _update_arena(self, dt: float):
+        if self.paused or not self._player_alive():
             return
+        for _ in range(self.timestep.advance(dt)):
+            player = self.arena.snakes[0]
+            turn = self.turns.pop(player.direction, time.perf_counter())
+            if turn is not None:
+                player.set_direction(turn)
+            for index in range(1, len(self.arena.snakes)):
+                if self.arena.snakes[index].alive:
+                    self.arena.snakes[index].set_direction(arena_greedy_policy(self.arena, index, self.rng))
+            self.arena.step()
 
-        background = (12, 16, 18)
-        surface.fill(background)
+    def render(self, surface: pygame.Surface) -> list[pygame.Rect] | None:
+        """Draw the board; returns the rects that changed, or None after a full redraw.
+
+        In ``incremental`` mode only the cells touched since the last frame and
+        the HUD (when its text changes) are repainted. Resizes, pausing,
+        game-over, rewinds and arena mode fall back to a full redraw.
+        """
+        self._ensure_game(surface)
+        if not self._has_session():
+            return None
+
+        state = (surface.get_size(), self.paused, self._player_alive())
+        if self.incremental and not self.arena and not self._full_redraw and state == self._drawn_state:
+            return self._render_dirty(surface)
+        self._full_redraw = False
+        self._drawn_state = state
+        self._drawn_hud = self._hud_key()
+        self._dirty_cells.clear()
 
         board_rect = self._board_rect(surface)
-        pygame.draw.rect(surface, (30, 34, 38), board_rect)
-        pygame.draw.rect(surface, (70, 70, 70), board_rect, 2)
+        surface.blit(self._board_background(surface, board_rect), (0, 0))
 
+        clip = self._clip_to_interior(surface, board_rect)
         self._draw_cells(surface, board_rect)
+        self._draw_motion(surface, board_rect)
+        surface.set_clip(clip)
         self._draw_hud(surface)
 
-        if self.paused and self.game.alive:
+        if self.paused and self._player_alive():
             self._draw_center_message(surface, "Paused", "Space to resume")
-        elif not self.game.alive:
-            self._draw_center_message(surface, "Game Over", "Press R or Enter to restart")
+        elif not self._player_alive():
+            if self.arena:
+                self._draw_center_message(surface, "Game Over", "R/Enter to restart, M for classic")
+            else:
+                self._draw_center_message(surface, "Game Over", "R/Enter to restart, Z to rewind")
+        return None
+
+    def _board_background(self, surface: pygame.Surface, board_rect: pygame.Rect) -> pygame.Surface:
+        # The background and empty board only change with the window size, so
+        # they are drawn once into a layer and blitted in a single call.
+        key = (surface.get_size(), tuple(board_rect))
+        if self._board_layer is None or self._board_layer_key != key:
+            layer = pygame.Surface(surface.get_size(), 0, surface)
+            layer.fill(self.background_color)
+            pygame.draw.rect(layer, self.board_color, board_rect)
+            pygame.draw.rect(layer, (70, 70, 70), board_rect, 2)
+            self._board_layer = layer
+            self._board_layer_key = key
+        return self._board_layer
+
+    def _text(self, slot: str, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Rendered ``text`` for a HUD/overlay slot, re-rendered only when it changes."""
+        key = (text, color)
+        cached = self._text_cache.get(slot)
+        if cached is None or cached[0] != key:
+            cached = (key, self.font.render(text, True, color))
+            self._text_cache[slot] = cached
+        return cached[1]
+
+    def _render_dirty(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        dirty = []
+        cells = self._dirty_cells | self._motion_drawn | self._motion_cells()
+        if cells:
+            board_rect = self._board_rect(surface)
+            clip = self._clip_to_interior(surface, board_rect)
+            interior = surface.get_clip()
+            game = self.game
+            occupancy = game.occupancy
+            head = game.snake[0]
+            for cell in cells:
+                # Clear the whole cell, not just its padded square: the motion
+                # overlay also paints the gaps between neighbouring cells.
+                bounds = pygame.Rect(
+                    board_rect.left + cell[0] * self.cell_size,
+                    board_rect.top + cell[1] * self.cell_size,
+                    self.cell_size,
+                    self.cell_size,
+                ).clip(interior)
+                surface.fill(self.board_color, bounds)
+                if cell == head:
+                    color = self.head_color
+                elif occupancy[cell[1] * game.grid_width + cell[0]]:
+                    color = self.body_color
+                elif cell == game.food:
+                    color = self.food_color
+                else:
+                    color = None
+                if color is not None:
+                    pygame.draw.rect(surface, color, self._cell_rect(board_rect, cell))
+                dirty.append(bounds)
+            self._draw_motion(surface, board_rect)
+            surface.set_clip(clip)
+            self._dirty_cells.clear()
+
+        hud_key = self._hud_key()
+        if hud_key != self._drawn_hud:
+            self._drawn_hud = hud_key
+            hud_rect = pygame.Rect(0, 0, surface.get_width(), self.top_padding)
+            surface.fill(self.background_color, hud_rect)
+            self._draw_hud(surface)
+            dirty.append(hud_rect)
+        return dirty
+
+    @staticmethod
+    def _clip_to_interior(surface: pygame.Surface, board_rect: pygame.Rect) -> pygame.Rect:
+        # Cells are only padded by cell_size // 8, so at small sizes edge
+        # cells would paint over the 2 px border; clip them to the inside of
+        # it. Returns the previous clip for the caller to restore.
+        clip = surface.get_clip()
+        surface.set_clip(board_rect.inflate(-4, -4).clip(clip))
+        return clip
+
+    def _motion_cells(self) -> set[tuple[int, int]]:
+        """Cells the in-between-ticks overlay drawn by ``_draw_motion`` touches."""
+        game = self.game
+        if not self.interpolate or self.arena or not game or not game.alive or self.paused or self._uses_bulk():
+            return set()
+        cells = {game.snake[0], game.snake[1]}
+        if self._prev_tail is not None and self._prev_tail != game.food and self._prev_tail not in cells:
+            cells.add(self._prev_tail)
+            cells.add(game.snake[-1])
+        return cells
+
+    def _draw_motion(self, surface: pygame.Surface, board_rect: pygame.Rect):
+        # Draw the head sliding out of the neck cell and the tail sliding out of
+        # the cell it just left, ``timestep.alpha`` of the way to the next tick,
+        # so motion looks smooth at any frame rate.
+        cells = self._motion_cells()
+        self._motion_drawn = cells
+        if not cells:
+            return
+        game = self.game
+        alpha = self.timestep.alpha
+        head, neck = game.snake[0], game.snake[1]
+        surface.fill(self.board_color, self._cell_rect(board_rect, head))
+        offset = (round((head[0] - neck[0]) * alpha * self.cell_size), round((head[1] - neck[1]) * alpha * self.cell_size))
+        pygame.draw.rect(surface, self.head_color, self._cell_rect(board_rect, neck).move(offset))
+        if self._prev_tail in cells:
+            tail = game.snake[-1]
+            previous = self._prev_tail
+            offset = (
+                round((tail[0] - previous[0]) * alpha * self.cell_size),
+                round((tail[1] - previous[1]) * alpha * self.cell_size),
+            )
+            pygame.draw.rect(surface, self.body_color, self._cell_rect(board_rect, previous).move(offset))
+
+    def _uses_bulk(self) -> bool:
+        return np is not None and self.cell_size <= self.bulk_render_max_cell
+
+    def _hud_key(self) -> tuple:
+        if self.arena:
+            return (self.arena.snakes[0].score, sum(snake.alive for snake in self.arena.snakes))
+        return (self.game.score if self.game else 0, self.autopilot is not None)
+
+    def _has_session(self) -> bool:
+        return self.game is not None or self.arena is not None
+
+    def _player_alive(self) -> bool:
+        if self.arena:
+            return self.arena.snakes[0].alive
+        return bool(self.game and self.game.alive)
 
     def _reset_game(self):
-        self.accumulator = 0.0
-        self.queued_direction = None
+        self.timestep.reset()
+        self._prev_tail = None
+        self.turns.clear()
         self.paused = False
+        self._stop_recording()
         self.game = None
+        self.arena = None
         self.last_surface_size = None
+        self._full_redraw = True
 
     def _ensure_game(self, surface: pygame.Surface):
         size = surface.get_size()
-        if self.game and self.last_surface_size == size:
+        if self._has_session() and self.last_surface_size == size:
             return
         grid_width = max(10, size[0] // self.cell_size)
         grid_height = max(10, (size[1] - self.top_padding) // self.cell_size)
-        self.game = SnakeGame.create(grid_width, grid_height, self.rng)
+        if self.arena_mode:
+            self.game = None
+            snake_count = min(1 + self.arena_bots, SnakeArena.capacity(grid_width, grid_height))
+            self.arena = SnakeArena.create(grid_width, grid_height, snake_count, rng=self.rng)
+            self.last_surface_size = size
+            return
+        self.arena = None
+        self._start_game(grid_width, grid_height)
+        if self.autopilot:
+            self.autopilot.prepare(grid_width, grid_height)
         self.last_surface_size = size
 
+    def _start_game(self, grid_width: int, grid_height: int):
+        self._stop_recording()
+        self.seed = self.rng.getrandbits(32)
+        self.game = SnakeGame.create(grid_width, grid_height, random.Random(self.seed))
+        self.game.enable_history(self.history_ticks, self.history_bytes)
+        self.tick = 0
+        if self.recorder is not None:
+            self.replay = self.recorder(self.seed, grid_width, grid_height)
+
+    def _stop_recording(self):
+        if self.replay is not None:
+            self.replay.close()
+            self.replay = None
+
     def _board_rect(self, surface: pygame.Surface) -> pygame.Rect:
-        grid_width = self.game.grid_width if self.game else 0
-        grid_height = self.game.grid_height if self.game else 0
+        board = self.arena or self.game
+        grid_width = board.grid_width if board else 0
+        grid_height = board.grid_height if board else 0
         width = grid_width * self.cell_size
         height = grid_height * self.cell_size
         x = (surface.get_width() - width) // 2
@@ -109,45 +402,96 @@ class SnakeScreen(Screen):
         return pygame.Rect(x, y, width, height)
 
     def _draw_cells(self, surface: pygame.Surface, board_rect: pygame.Rect):
+        body_color = self.body_color
+        head_color = self.head_color
+        food_color = self.food_color
+
+        if self.arena:
+            for index, snake in enumerate(self.arena.snakes):
+                if not snake.alive:
+                    continue
+                color = body_color if index == 0 else self.bot_colors[(index - 1) % len(self.bot_colors)]
+                head = head_color if index == 0 else tuple(min(255, c + 40) for c in color)
+                self._draw_snake(surface, board_rect, snake.body, color, head)
+            for cell in self.arena.food:
+                pygame.draw.rect(surface, food_color, self._cell_rect(board_rect, cell))
+            return
+
         if not self.game:
             return
-        padding = 3
-        body_color = (90, 200, 120)
-        head_color = (130, 240, 160)
-        food_color = (220, 80, 60)
-
-        for i, (x, y) in enumerate(self.game.snake):
-            cell_rect = pygame.Rect(
-                board_rect.left + x * self.cell_size + padding,
-                board_rect.top + y * self.cell_size + padding,
-                self.cell_size - padding * 2,
-                self.cell_size - padding * 2,
-            )
-            color = head_color if i == 0 else body_color
-            pygame.draw.rect(surface, color, cell_rect)
+        if self._uses_bulk():
+            self._draw_cells_bulk(surface, board_rect)
+            return
+        self._draw_snake(surface, board_rect, self.game.snake, body_color, head_color)
 
         if self.game.food is not None:
-            fx, fy = self.game.food
-            food_rect = pygame.Rect(
-                board_rect.left + fx * self.cell_size + padding,
-                board_rect.top + fy * self.cell_size + padding,
-                self.cell_size - padding * 2,
-                self.cell_size - padding * 2,
-            )
-            pygame.draw.rect(surface, food_color, food_rect)
+            pygame.draw.rect(surface, food_color, self._cell_rect(board_rect, self.game.food))
+
+    def _draw_cells_bulk(self, surface: pygame.Surface, board_rect: pygame.Rect):
+        # With tiny cells one draw call per segment dominates the frame, so the
+        # board is written as one pixel per cell and scaled up in a single blit.
+        game = self.game
+        size = (game.grid_width, game.grid_height)
+        if self._grid_surface is None or self._grid_surface.get_size() != size:
+            self._grid_surface = pygame.Surface(size, 0, 32)
+            self._grid_pixels = np.empty((*size, 3), dtype=np.uint8)
+            self._palette = np.array([self.board_color, self.body_color], dtype=np.uint8)
+        if self._scaled_grid is None or self._scaled_grid.get_size() != board_rect.size:
+            self._scaled_grid = pygame.Surface(board_rect.size, 0, self._grid_surface)
+
+        occupancy = np.frombuffer(game.occupancy, dtype=np.uint8).reshape(game.grid_height, game.grid_width)
+        np.take(self._palette, occupancy.T, axis=0, out=self._grid_pixels)
+        head_x, head_y = game.snake[0]
+        self._grid_pixels[head_x, head_y] = self.head_color
+        if game.food is not None:
+            self._grid_pixels[game.food] = self.food_color
+        pygame.surfarray.blit_array(self._grid_surface, self._grid_pixels)
+        pygame.transform.scale(self._grid_surface, board_rect.size, self._scaled_grid)
+        surface.blit(self._scaled_grid, board_rect)
+
+    def _draw_snake(
+        self,
+        surface: pygame.Surface,
+        board_rect: pygame.Rect,
+        body: Iterable[tuple[int, int]],
+        body_color: tuple[int, int, int],
+        head_color: tuple[int, int, int],
+    ):
+        for i, cell in enumerate(body):
+            color = head_color if i == 0 else body_color
+            pygame.draw.rect(surface, color, self._cell_rect(board_rect, cell))
+
+    def _cell_rect(self, board_rect: pygame.Rect, cell: tuple[int, int]) -> pygame.Rect:
+        padding = min(3, self.cell_size // 8)
+        x, y = cell
+        return pygame.Rect(
+            board_rect.left + x * self.cell_size + padding,
+            board_rect.top + y * self.cell_size + padding,
+            self.cell_size - padding * 2,
+            self.cell_size - padding * 2,
+        )
 
     def _draw_hud(self, surface: pygame.Surface):
-        if not self.game:
-            return
         label_color = (220, 220, 220)
-        score_text = self.font.render(f"Score: {self.game.score}", True, label_color)
-        hint_text = self.font.render("Arrows/WASD to move. Esc: Menu", True, (160, 160, 160))
+        if self.arena:
+            bots_left = sum(snake.alive for snake in self.arena.snakes[1:])
+            score_label = f"Score: {self.arena.snakes[0].score}  Bots left: {bots_left}"
+            hint = "Arrows/WASD to move. M: Classic. Esc: Menu"
+        elif self.game:
+            score_label = f"Score: {self.game.score}"
+            if self.autopilot:
+                score_label += "  [Autopilot - Tab to take over]"
+            hint = "Arrows/WASD to move. Z: Rewind. M: Arena. Esc: Menu"
+        else:
+            return
+        score_text = self._text("score", score_label, label_color)
+        hint_text = self._text("hint", hint, (160, 160, 160))
         surface.blit(score_text, (16, 12))
         surface.blit(hint_text, (16, 34))
 
     def _draw_center_message(self, surface: pygame.Surface, title: str, subtitle: str):
-        title_text = self.font.render(title, True, (240, 240, 240))
-        subtitle_text = self.font.render(subtitle, True, (190, 190, 190))
+        title_text = self._text("title", title, (240, 240, 240))
+        subtitle_text = self._text("subtitle", subtitle, (190, 190, 190))
         rect = title_text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 - 10))
         sub_rect = subtitle_text.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 24))
         surface.blit(title_text, rect)
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+import functools
+import random
+import time
+
+from snake_logic import Direction, SnakeGame
+
+
+def hamiltonian_cycle(grid_width: int, grid_height: int) -> list[int] | None:
+    """Cell indices of a Hamiltonian cycle over the grid, or None if none exists.
+
+    Rows are swept boustrophedon-style from column 1 onwards and column 0 is
+    kept as the return lane, which needs an even number of rows (or columns,
+    in which case the sweep is transposed).
+    """
+    if grid_width < 2 or grid_height < 2:
+        return None
+    if grid_height % 2 == 0:
+        order = [(x, 0) for x in range(grid_width)]
+        for y in range(1, grid_height):
+            xs = range(grid_width - 1, 0, -1) if y % 2 else range(1, grid_width)
+            order.extend((x, y) for x in xs)
+        order.extend((0, y) for y in range(grid_height - 1, 0, -1))
+        return [y * grid_width + x for x, y in order]
+    if grid_width % 2 == 0:
+        transposed = hamiltonian_cycle(grid_height, grid_width)
+        return [(index % grid_height) * grid_width + index // grid_height for index in transposed]
+    return None
+
+
+def _cycle_with_spare(grid_width: int, grid_height: int) -> tuple[list[int], int]:
+    """A cycle over every cell of an odd-by-odd grid but its bottom-right corner, and that corner.
+
+    The cycle runs along row 0, sweeps rows 1 to ``grid_height - 3`` from
+    column 1 as ``hamiltonian_cycle`` does, zigzags down and up through the
+    last two rows from right to left and returns up column 0. The corner and
+    the cell diagonally inside it are both adjacent to the cycle cells either
+    side of that inner cell, so the spare can take its place in the cycle.
+    """
+    w, h = grid_width, grid_height
+    order = [(x, 0) for x in range(w)]
+    for y in range(1, h - 2):
+        xs = range(w - 1, 0, -1) if y % 2 else range(1, w)
+        order.extend((x, y) for x in xs)
+    order.append((w - 1, h - 2))
+    for x in range(w - 2, 0, -1):
+        ys = (h - 2, h - 1) if (w - 2 - x) % 2 == 0 else (h - 1, h - 2)
+        order.extend((x, y) for y in ys)
+    order.extend((0, y) for y in range(h - 1, 0, -1))
+    return [y * w + x for x, y in order], (h - 1) * w + w - 1
+
+
+@functools.lru_cache(maxsize=4)
+def _layout(grid_width: int, grid_height: int) -> tuple[list[int] | None, array | None, int | None]:
+    """The cycle, each cell's position on it and the spare cell for a grid size.
+
+    Cached, so every ``Autopilot`` on a grid of that size shares one copy.
+    """
+    cells = grid_width * grid_height
+    cycle = hamiltonian_cycle(grid_width, grid_height)
+    spare = None
+    if cycle is None and grid_width >= 3 and grid_height >= 3:
+        cycle, spare = _cycle_with_spare(grid_width, grid_height)
+    if cycle is None:
+        return None, None, None
+    position = array("i", [-1]) * cells
+    for number, index in enumerate(cycle):
+        position[index] = number
+    if spare is not None:
+        position[spare] = position[(grid_height - 2) * grid_width + grid_width - 2]
+    return cycle, position, spare
+
+
+class Autopilot:
+    """Plays a ``SnakeGame`` by walking a cached BFS distance field to the food.
+
+    The distance field is grown outwards from the food a slice at a time, within
+    ``time_budget`` seconds per tick, and kept across ticks until the food
+    moves. Labels can go stale as the body moves on (a cell labelled while
+    free may be covered later, and cells the tail frees are not relabelled),
+    so they only rank moves that ``is_safe`` has already allowed. Moves are
+    constrained to a Hamiltonian cycle: shortcuts off it are taken only when
+    they get closer to the food along the cycle and cannot overtake the tail,
+    which keeps long snakes from boxing themselves in. Odd-by-odd grids have
+    no such cycle, so they use one that skips a corner cell and lets the snake
+    swap that corner in for its neighbour on the cycle when it needs to.
+
+    The cycle is built by ``prepare``; call it as soon as the grid size is
+    known so that the first ``choose`` stays within budget too.
+    """
+
+    def __init__(self, time_budget: float = 0.002, shortcut_fill: float = 0.5):
+        self.time_budget = time_budget
+        self.shortcut_fill = shortcut_fill
+        self.game: SnakeGame | None = None
+        self.grid_size: tuple[int, int] = (0, 0)
+        self.cycle_position: array | None = None
+        self.cycle: list[int] | None = None
+        self.spare: int | None = None
+        self.distance = array("i")
+        self.frontier: deque[int] = deque()
+        self.target: tuple[int, int] | None = None
+
+    def prepare(self, grid_width: int, grid_height: int) -> None:
+        """Build (or fetch the cached) cycle for a grid size."""
+        if self.grid_size == (grid_width, grid_height):
+            return
+        self.grid_size = (grid_width, grid_height)
+        self.cycle, self.cycle_position, self.spare = _layout(grid_width, grid_height)
+        self.distance = array("i")
+
+    def choose(self, game: SnakeGame) -> Direction:
+        deadline = time.perf_counter() + self.time_budget
+        self._attach(game)
+        width = game.grid_width
+        head_x, head_y = game.snake[0]
+        head = head_y * width + head_x
+        if game.food != self.target or len(self.distance) != width * game.grid_height:
+            self._retarget(game)
+        self._explore(game, deadline)
+
+        # With a cycle, every candidate must move strictly closer to the food
+        # along it, so the snake cannot loop; the BFS labels then pick the
+        # shortcut that is physically nearest to the food.
+        food_gap = self._cycle_gap(head, game.food, width)
+        best: int | None = None
+        best_key: tuple[int, int] | None = None
+        for neighbour in self._neighbours(head, width, game.grid_height):
+            if not game.is_safe(neighbour % width, neighbour // width):
+                continue
+            gap = 0
+            if self.cycle_position is not None and food_gap is not None:
+                gap = self._cycle_gap(neighbour, game.food, width)
+                if gap >= food_gap or not self._shortcut_ok(game, head, neighbour):
+                    continue
+            distance = self.distance[neighbour]
+            if distance < 0:
+                if self.cycle_position is None:
+                    continue
+                distance = len(self.distance)
+            key = (distance, gap)
+            if best_key is None or key < best_key:
+                best = neighbour
+                best_key = key
+
+        if best is None and not self.frontier and game.food is not None:
+            # The search ran dry while the body walled the food off; the body
+            # has moved since, so start a fresh search for the next tick.
+            self._retarget(game)
+        if best is None:
+            best = self._fallback(game, head)
+        if best is None:
+            return game.direction
+        return (best % width - head_x, best // width - head_y)
+
+    def __call__(self, game: SnakeGame, rng: random.Random | None = None) -> Direction:
+        return self.choose(game)
+
+    def _attach(self, game: SnakeGame) -> None:
+        if game is self.game and self.grid_size == (game.grid_width, game.grid_height):
+            return
+        self.game = game
+        self.prepare(game.grid_width, game.grid_height)
+        self.distance = array("i")
+
+    def _retarget(self, game: SnakeGame) -> None:
+        self.target = game.food
+        self.distance = array("i", [-1]) * (game.grid_width * game.grid_height)
+        self.frontier.clear()
+        if game.food is not None:
+            food = game.food[1] * game.grid_width + game.food[0]
+            self.distance[food] = 0
+            self.frontier.append(food)
+
+    def _explore(self, game: SnakeGame, deadline: float) -> None:
+        # Neighbours are expanded inline: building a list per cell made the
+        # garbage collector run mid-search, blowing through the budget.
+        width = game.grid_width
+        last_row = width * (game.grid_height - 1)
+        occupied = game.occupancy
+        distance = self.distance
+        frontier = self.frontier
+        visited = 0
+        while frontier:
+            index = frontier.popleft()
+            next_distance = distance[index] + 1
+            x = index % width
+            if x > 0 and distance[index - 1] < 0 and not occupied[index - 1]:
+                distance[index - 1] = next_distance
+                frontier.append(index - 1)
+            if x < width - 1 and distance[index + 1] < 0 and not occupied[index + 1]:
+                distance[index + 1] = next_distance
+                frontier.append(index + 1)
+            if index >= width and distance[index - width] < 0 and not occupied[index - width]:
+                distance[index - width] = next_distance
+                frontier.append(index - width)
+            if index < last_row and distance[index + width] < 0 and not occupied[index + width]:
+                distance[index + width] = next_distance
+                frontier.append(index + width)
+            visited += 1
+            if visited & 31 == 0 and time.perf_counter() > deadline:
+                return
+
+    def _cycle_gap(self, index: int, cell: tuple[int, int] | None, width: int) -> int | None:
+        if self.cycle_position is None or cell is None:
+            return None
+        position = self.cycle_position
+        return (position[cell[1] * width + cell[0]] - position[index]) % len(self.cycle)
+
+    def _shortcut_ok(self, game: SnakeGame, head: int, neighbour: int) -> bool:
+        if self.cycle_position is None:
+            return True
+        cells = len(self.cycle)
+        position = self.cycle_position
+        step = (position[neighbour] - position[head]) % cells
+        if step == 1:
+            return True
+        if len(game.snake) > cells * self.shortcut_fill:
+            return False
+        tail_x, tail_y = game.snake[-1]
+        to_tail = (position[tail_y * game.grid_width + tail_x] - position[head]) % cells
+        return step < to_tail - (game.grow_pending + 4)
+
+    def _fallback(self, game: SnakeGame, head: int) -> int | None:
+        width = game.grid_width
+        if self.cycle is not None:
+            following = self.cycle[(self.cycle_position[head] + 1) % len(self.cycle)]
+            candidates = [following]
+            if self.spare is not None and self.cycle_position[self.spare] == self.cycle_position[following]:
+                candidates.append(self.spare)
+            for cell in candidates:
+                if game.is_safe(cell % width, cell // width):
+                    return cell
+        occupied = game.occupancy
+        best = None
+        best_exits = -1
+        for neighbour in self._neighbours(head, width, game.grid_height):
+            if not game.is_safe(neighbour % width, neighbour // width):
+                continue
+            exits = sum(1 for cell in self._neighbours(neighbour, width, game.grid_height) if not occupied[cell])
+            if exits > best_exits:
+                best = neighbour
+                best_exits = exits
+        return best
+
+    @staticmethod
+    def _neighbours(index: int, width: int, height: int) -> list[int]:
+        x = index % width
+        result = []
+        if x > 0:
+            result.append(index - 1)
+        if x < width - 1:
+            result.append(index + 1)
+        if index >= width:
+            result.append(index - width)
+        if index < width * (height - 1):
+            result.append(index + width)
+        return result
+
+
+_shared = Autopilot()
+
+
+def autopilot_policy(game: SnakeGame, rng: random.Random) -> Direction:
+    """``snake_sim`` policy backed by one ``Autopilot`` per process."""
+    return _shared.choose(game)
+
+
+__all__ = ["Autopilot", "autopilot_policy", "hamiltonian_cycle"]
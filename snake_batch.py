@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import random
+from typing import Iterable
+
+import numpy as np
+
+from snake_logic import Direction
+
+
+class BatchSnakeGame:
+    """Steps many independent ``SnakeGame`` boards in lockstep.
+
+    Every per-game field of ``SnakeGame`` is held as a NumPy array with one row
+    per game, so a single ``step`` advances all boards with vectorized wall,
+    self-collision, food and growth handling. Each game keeps its own
+    ``random.Random`` and places food by the same row-major draw over free
+    cells as the scalar engine, which makes game ``i`` play out exactly like
+    a ``SnakeGame`` created from the same seed. Games that die are reset in place.
+    """
+
+    def __init__(self, grid_width: int, grid_height: int, rngs: list[random.Random]):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.rngs = rngs
+        self.count = len(rngs)
+        cells = grid_width * grid_height
+        n = self.count
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head_pos = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.occupied = np.zeros((n, cells), dtype=bool)
+        self.free_count = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros((n, 2), dtype=np.int32)
+        self.food = np.full(n, -1, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.grow_pending = np.zeros(n, dtype=np.int32)
+        self._rows = np.arange(n)
+        for game in range(n):
+            self._reset_game(game)
+
+    @classmethod
+    def create(cls, grid_width: int, grid_height: int, seeds: Iterable[int]) -> "BatchSnakeGame":
+        return cls(grid_width, grid_height, [random.Random(seed) for seed in seeds])
+
+    def step(self, actions: np.ndarray | Iterable[Direction]) -> np.ndarray:
+        """Advance every game by one tick.
+
+        ``actions`` holds one ``(dx, dy)`` direction per game; reversals are
+        ignored just like ``SnakeGame.set_direction``. Returns a boolean array
+        marking the games that died this tick (and have already been reset).
+        """
+        width = self.grid_width
+        cells = self.body.shape[1]
+        rows = self._rows
+        actions = np.asarray(actions, dtype=np.int32).reshape(self.count, 2)
+        reverse = np.all(actions == -self.direction, axis=1)
+        self.direction = np.where(reverse[:, None], self.direction, actions)
+
+        head = self.body[rows, self.head_pos]
+        new_x = head % width + self.direction[:, 0]
+        new_y = head // width + self.direction[:, 1]
+        wall = (new_x < 0) | (new_x >= width) | (new_y < 0) | (new_y >= self.grid_height)
+        new_head = np.where(wall, 0, new_y * width + new_x)
+
+        tail_pos = (self.head_pos - self.length + 1) % cells
+        tail = self.body[rows, tail_pos]
+        eating = ~wall & (new_head == self.food)
+        grows = eating | (self.grow_pending > 0)
+        hit = ~wall & self.occupied[rows, new_head] & (grows | (new_head != tail))
+        done = wall | hit
+        alive = ~done
+
+        popping = rows[alive & ~grows]
+        popped = tail[popping]
+        self.occupied[popping, popped] = False
+        self.free_count[popping] += 1
+        self.length[popping] -= 1
+
+        moving = rows[alive]
+        pushed = new_head[moving]
+        self.head_pos[moving] = (self.head_pos[moving] + 1) % cells
+        self.body[moving, self.head_pos[moving]] = pushed
+        self.length[moving] += 1
+        self.occupied[moving, pushed] = True
+        self.free_count[moving] -= 1
+
+        self.grow_pending[alive & ~eating & (self.grow_pending > 0)] -= 1
+        for game in np.flatnonzero(alive & eating):
+            self.score[game] += 1
+            self._spawn_food(game)
+        for game in np.flatnonzero(done):
+            self._reset_game(game)
+        return done
+
+    def snake(self, game: int) -> list[tuple[int, int]]:
+        cells = self.body.shape[1]
+        positions = (self.head_pos[game] - np.arange(self.length[game])) % cells
+        return [(int(index) % self.grid_width, int(index) // self.grid_width) for index in self.body[game, positions]]
+
+    def snapshot(self, game: int) -> dict:
+        food = int(self.food[game])
+        return {
+            "snake": self.snake(game),
+            "direction": (int(self.direction[game, 0]), int(self.direction[game, 1])),
+            "food": None if food < 0 else (food % self.grid_width, food // self.grid_width),
+            "score": int(self.score[game]),
+            "alive": True,
+            "grow_pending": int(self.grow_pending[game]),
+        }
+
+    def _reset_game(self, game: int) -> None:
+        width = self.grid_width
+        start = (self.grid_height // 2) * width + width // 2
+        initial = np.array([start - 2, start - 1, start], dtype=np.int32)
+        self.occupied[game] = False
+        self.occupied[game, initial] = True
+        self.free_count[game] = self.occupied.shape[1] - len(initial)
+        self.body[game, :3] = initial
+        self.head_pos[game] = 2
+        self.length[game] = 3
+        self.direction[game] = (1, 0)
+        self.score[game] = 0
+        self.grow_pending[game] = 0
+        self._spawn_food(game)
+
+    def _spawn_food(self, game: int) -> None:
+        # ``randrange(n)`` consumes the rng exactly like SnakeGame's draw of
+        # the k-th free cell in row-major order, which keeps food in step.
+        count = int(self.free_count[game])
+        if count == 0:
+            self.food[game] = -1
+            return
+        self.food[game] = np.flatnonzero(~self.occupied[game])[self.rngs[game].randrange(count)]
+
+
+__all__ = ["BatchSnakeGame"]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable
+
+from snake_autopilot import hamiltonian_cycle
+from snake_logic import SnakeGame
+
+
+GRIDS = [(8, 6), (32, 32), (200, 200), (1000, 1000)]
+QUICK_GRIDS = [(8, 6), (32, 32)]
+SEED = 1234
+
+
+def _time_per_op(run: Callable[[], None], ops: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best / ops
+
+
+def _time_per_call(call: Callable[[], object], repeat: int, min_sample: float) -> float:
+    """Best seconds per ``call()``.
+
+    Each sample loops ``call`` for at least ``min_sample`` seconds, so calls
+    that take microseconds are not timed one at a time against timer noise.
+    """
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            call()
+        if time.perf_counter() - started >= min_sample:
+            break
+        loops *= 10 if loops < 1000 else 2
+
+    def run() -> None:
+        for _ in range(loops):
+            call()
+
+    return _time_per_op(run, loops, repeat)
+
+
+def _lengths(grid_width: int, grid_height: int) -> list[int]:
+    cells = grid_width * grid_height
+    return sorted({3, cells // 2, cells - 1})
+
+
+def _serpentine_game(grid_width: int, grid_height: int, length: int, cycle: list[int]) -> SnakeGame:
+    """A game whose body lies along ``cycle`` so it can keep stepping forever."""
+    game = SnakeGame.create(grid_width, grid_height, random.Random(SEED))
+    head = length - 1
+    game.snake = [(cycle[i] % grid_width, cycle[i] // grid_width) for i in range(head, -1, -1)]
+    after = cycle[(head + 1) % len(cycle)]
+    game.direction = (after % grid_width - cycle[head] % grid_width, after // grid_width - cycle[head] // grid_width)
+    game.food = game._spawn_food()
+    return game
+
+
+def _cycle_directions(grid_width: int, cycle: list[int]) -> list[tuple[int, int]]:
+    directions = [(0, 0)] * len(cycle)
+    for i, index in enumerate(cycle):
+        after = cycle[(i + 1) % len(cycle)]
+        directions[index] = (after % grid_width - index % grid_width, after // grid_width - index // grid_width)
+    return directions
+
+
+def run_benchmarks(
+    grids: list[tuple[int, int]], ticks: int = 2000, repeat: int = 5, min_sample: float = 0.01
+) -> dict[str, float]:
+    """Seconds per operation for every benchmark case, keyed by case name.
+
+    Steps are timed ``ticks`` at a time; every other operation is looped for
+    at least ``min_sample`` seconds per sample.
+    """
+    results: dict[str, float] = {}
+    for grid_width, grid_height in grids:
+        grid = f"{grid_width}x{grid_height}"
+        results[f"create[{grid}]"] = _time_per_call(
+            lambda: SnakeGame.create(grid_width, grid_height, random.Random(SEED)), repeat, min_sample
+        )
+        cycle = hamiltonian_cycle(grid_width, grid_height)
+        directions = _cycle_directions(grid_width, cycle)
+        for length in _lengths(grid_width, grid_height):
+            case = f"{grid},len={length}"
+            game = _serpentine_game(grid_width, grid_height, length, cycle)
+
+            def step() -> None:
+                for _ in range(ticks):
+                    head_x, head_y = game.snake[0]
+                    game.set_direction(directions[head_y * grid_width + head_x])
+                    game.step()
+
+            results[f"step[{case}]"] = _time_per_op(step, ticks, repeat)
+            results[f"spawn_food[{case}]"] = _time_per_call(game._spawn_food, repeat, min_sample)
+            snapshot = game.snapshot()
+            packed = game.pack_snapshot()
+            results[f"snapshot[{case}]"] = _time_per_call(game.snapshot, repeat, min_sample)
+            results[f"load[{case}]"] = _time_per_call(lambda: game.load(snapshot), repeat, min_sample)
+            results[f"pack_snapshot[{case}]"] = _time_per_call(game.pack_snapshot, repeat, min_sample)
+            results[f"load_packed[{case}]"] = _time_per_call(lambda: game.load(packed), repeat, min_sample)
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Describe every case that is more than ``threshold`` slower than the baseline."""
+    regressions = []
+    for case, seconds in results.items():
+        before = baseline.get(case)
+        if before and seconds > before * (1.0 + threshold):
+            regressions.append(f"{case}: {before * 1e6:.2f}us -> {seconds * 1e6:.2f}us ({seconds / before - 1.0:+.0%})")
+    return regressions
+
+
+def confirm(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    rerun: Callable[[], dict[str, float]],
+    attempts: int,
+) -> tuple[dict[str, float], list[str]]:
+    """``compare``, re-running the benchmarks up to ``attempts`` times while anything looks slow.
+
+    Each case keeps its best time over all runs. A slowdown from a busy host
+    rarely hits the same case run after run; one in the code does, so only
+    that survives.
+    """
+    regressions = compare(results, baseline, threshold)
+    for _ in range(attempts):
+        if not regressions:
+            break
+        again = rerun()
+        results = {case: min(seconds, again.get(case, seconds)) for case, seconds in results.items()}
+        regressions = compare(results, baseline, threshold)
+    return results, regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark snake_logic across grid sizes and snake lengths.")
+    parser.add_argument("--quick", action="store_true", help=f"only run {QUICK_GRIDS}")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-sample", type=float, default=0.01, help="seconds each timed sample must last")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.0,
+        help="allowed slowdown before failing (1.0 = twice as slow, the default: single cases "
+        "vary by up to ~100%% between runs on a shared VM, so tighter gates need a quiet machine)",
+    )
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=2,
+        help="re-run this many times while a case looks slow, keeping each case's best time (default: 2)",
+    )
+    args = parser.parse_args(argv)
+
+    grids = QUICK_GRIDS if args.quick else GRIDS
+    results = run_benchmarks(grids, args.ticks, args.repeat, args.min_sample)
+    regressions: list[str] = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["seconds_per_op"]
+        results, regressions = confirm(
+            results,
+            baseline,
+            args.threshold,
+            lambda: run_benchmarks(grids, args.ticks, args.repeat, args.min_sample),
+            args.confirm,
+        )
+    report = {"python": platform.python_version(), "seed": SEED, "seconds_per_op": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    for case, seconds in results.items():
+        print(f"{case:45s} {seconds * 1e6:12.2f} us")
+
+    if regressions:
+        print("Regressions:", *regressions, sep="\n  ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
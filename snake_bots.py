@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import random
+
+from snake_logic import Direction, SnakeArena, SnakeGame, _is_opposite
+
+
+DIRECTIONS: tuple[Direction, ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def random_policy(game: SnakeGame, rng: random.Random) -> Direction:
+    return rng.choice([d for d in DIRECTIONS if not _is_opposite(d, game.direction)])
+
+
+def greedy_policy(game: SnakeGame, rng: random.Random) -> Direction:
+    head_x, head_y = game.snake[0]
+    safe = [d for d in DIRECTIONS if not _is_opposite(d, game.direction) and game.is_safe(head_x + d[0], head_y + d[1])]
+    if not safe:
+        return game.direction
+    if game.food is None:
+        return rng.choice(safe)
+    food_x, food_y = game.food
+    return min(safe, key=lambda d: abs(food_x - head_x - d[0]) + abs(food_y - head_y - d[1]))
+
+
+def arena_greedy_policy(arena: SnakeArena, index: int, rng: random.Random) -> Direction:
+    """Greedy bot for one snake in a ``SnakeArena``: nearest food, safe moves only."""
+    snake = arena.snakes[index]
+    head_x, head_y = snake.body[0]
+    safe = [d for d in DIRECTIONS if not _is_opposite(d, snake.direction) and arena.is_safe(head_x + d[0], head_y + d[1])]
+    if not safe:
+        return snake.direction
+    if not arena.food:
+        return rng.choice(safe)
+    food_x, food_y = min(arena.food, key=lambda cell: abs(cell[0] - head_x) + abs(cell[1] - head_y))
+    return min(safe, key=lambda d: abs(food_x - head_x - d[0]) + abs(food_y - head_y - d[1]))
+
+
+__all__ = ["DIRECTIONS", "arena_greedy_policy", "greedy_policy", "random_policy"]
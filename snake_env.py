@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from snake_logic import Direction, SnakeGame
+
+
+ACTIONS: tuple[Direction, ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+BODY, HEAD, FOOD, WALL = range(4)
+CHANNELS = 4
+
+
+class SnakeEnv:
+    """Gym-style wrapper around ``SnakeGame`` for training agents.
+
+    Observations are ``(CHANNELS, rows, cols)`` float32 grids with body, head,
+    food and wall planes. The board lives in one preallocated buffer padded by
+    ``view_radius`` wall cells on every side; each step only rewrites the
+    head, tail and food cells, so there is no per-step allocation. With
+    ``view="full"`` the observation is a view of the unpadded board, and with
+    ``view="ego"`` it is a ``2 * view_radius + 1`` square centred on the head,
+    copied into its own preallocated buffer. Either way the returned array is
+    overwritten by the next ``step``/``reset``; copy it to keep it.
+    """
+
+    def __init__(
+        self,
+        grid_width: int,
+        grid_height: int,
+        view: str = "full",
+        view_radius: int = 5,
+        max_steps: int | None = None,
+    ):
+        if view not in ("full", "ego"):
+            raise ValueError(f"view must be 'full' or 'ego', not {view!r}")
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.view = view
+        self.view_radius = view_radius
+        self.max_steps = max_steps
+        self.food_reward = 1.0
+        self.death_reward = -1.0
+        self.step_reward = 0.0
+        pad = view_radius if view == "ego" else 0
+        self.board = np.zeros((CHANNELS, grid_height + 2 * pad, grid_width + 2 * pad), dtype=np.float32)
+        self.inner = self.board[:, pad : pad + grid_height, pad : pad + grid_width]
+        size = 2 * view_radius + 1
+        self.observation = self.inner if view == "full" else np.zeros((CHANNELS, size, size), dtype=np.float32)
+        self.game: SnakeGame | None = None
+        self.steps = 0
+
+    def reset(self, seed: int | None = None) -> np.ndarray:
+        self.game = SnakeGame.create(self.grid_width, self.grid_height, random.Random(seed))
+        self.steps = 0
+        self.board.fill(0.0)
+        self.board[WALL] = 1.0
+        self.inner[WALL] = 0.0
+        for x, y in self.game.snake:
+            self.inner[BODY, y, x] = 1.0
+        head_x, head_y = self.game.snake[0]
+        self.inner[HEAD, head_y, head_x] = 1.0
+        if self.game.food is not None:
+            food_x, food_y = self.game.food
+            self.inner[FOOD, food_y, food_x] = 1.0
+        return self._observe()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        game = self.game
+        if game is None:
+            raise RuntimeError("SnakeEnv.reset() must be called before step()")
+        old_head = game.snake[0]
+        old_tail = game.snake[-1]
+        old_food = game.food
+        old_score = game.score
+
+        game.set_direction(ACTIONS[action])
+        game.step()
+        self.steps += 1
+
+        if game.alive:
+            inner = self.inner
+            head_x, head_y = game.snake[0]
+            if game.snake[-1] != old_tail:
+                inner[BODY, old_tail[1], old_tail[0]] = 0.0
+            inner[BODY, head_y, head_x] = 1.0
+            inner[HEAD, old_head[1], old_head[0]] = 0.0
+            inner[HEAD, head_y, head_x] = 1.0
+            if game.food != old_food:
+                if old_food is not None:
+                    inner[FOOD, old_food[1], old_food[0]] = 0.0
+                if game.food is not None:
+                    inner[FOOD, game.food[1], game.food[0]] = 1.0
+
+        if not game.alive:
+            reward = self.death_reward
+        elif game.score > old_score:
+            reward = self.food_reward
+        else:
+            reward = self.step_reward
+        truncated = self.max_steps is not None and self.steps >= self.max_steps
+        done = not game.alive or game.food is None or truncated
+        info = {"score": game.score, "length": len(game.snake), "steps": self.steps, "truncated": truncated}
+        return self._observe(), reward, done, info
+
+    def _observe(self) -> np.ndarray:
+        if self.view == "full":
+            return self.observation
+        head_x, head_y = self.game.snake[0]
+        size = 2 * self.view_radius + 1
+        np.copyto(self.observation, self.board[:, head_y : head_y + size, head_x : head_x + size])
+        return self.observation
+
+
+__all__ = ["ACTIONS", "SnakeEnv"]
@@ -1,12 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+import math
 import random
-from typing import Iterable
+import struct
+import sys
+from typing import Sequence
 
 
 Direction = tuple[int, int]
 
+# Packed snapshot: magic, grid size, direction, food cell (-1 for none),
+# score, alive, grow_pending and body length, followed by the body as
+# little-endian uint32 cell indices (``y * grid_width + x``), head first.
+_SNAPSHOT_MAGIC = b"SNK1"
+_SNAPSHOT_HEADER = struct.Struct("<4sHHbbiI?II")
+# Packed delta: the new head cell, body length after the tick, then the same
+# scalar fields as the snapshot header.
+_DELTA = struct.Struct("<IIbbiI?I")
+
+# Rough ``sys.getsizeof`` costs used to keep rewind history inside its byte
+# budget: one undo record, and the rng state saved on ticks that spawn food.
+_HISTORY_ENTRY_BYTES = 96
+_RNG_STATE_BYTES = 24_500
+
+# Undo record for one ``step``: whether the head moved, the tail it popped,
+# and the food, score, grow_pending and rng state from before the tick.
+_Undo = tuple[bool, tuple[int, int] | None, tuple[int, int] | None, int, int, tuple | None]
+
 
 def _is_opposite(a: Direction, b: Direction) -> bool:
     return a[0] == -b[0] and a[1] == -b[1]
@@ -17,12 +40,24 @@ class SnakeGame:
     grid_width: int
     grid_height: int
     rng: random.Random
-    snake: list[tuple[int, int]]
+    snake: Sequence[tuple[int, int]]
     direction: Direction
     food: tuple[int, int] | None
     score: int
     alive: bool
     grow_pending: int
+    _body: deque[tuple[int, int]] = field(init=False, repr=False, compare=False)
+    _occupied: bytearray = field(init=False, repr=False, compare=False)
+    _free_count: int = field(init=False, repr=False, compare=False)
+    _block_size: int = field(init=False, repr=False, compare=False)
+    _block_free: list[int] = field(init=False, repr=False, compare=False)
+    _history: deque[_Undo] | None = field(default=None, init=False, repr=False, compare=False)
+    _history_ticks: int = field(default=0, init=False, repr=False, compare=False)
+    _history_budget: int | None = field(default=None, init=False, repr=False, compare=False)
+    _history_bytes: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rebuild()
 
     @classmethod
     def create(cls, grid_width: int, grid_height: int, rng: random.Random | None = None) -> "SnakeGame":
@@ -61,45 +96,185 @@ class SnakeGame:
     def step(self) -> None:
         if not self.alive:
             return
-        head_x, head_y = self.snake[0]
+        self._sync()
+        body = self._body
+        head_x, head_y = body[0]
         dx, dy = self.direction
-        new_head = (head_x + dx, head_y + dy)
-        if not (0 <= new_head[0] < self.grid_width and 0 <= new_head[1] < self.grid_height):
+        new_x = head_x + dx
+        new_y = head_y + dy
+        if not (0 <= new_x < self.grid_width and 0 <= new_y < self.grid_height):
+            if self._history is not None:
+                self._remember(False, None, None)
             self.alive = False
             return
 
-        tail = self.snake[-1]
-        body = set(self.snake)
-        if new_head in body and not (self.grow_pending == 0 and new_head == tail):
+        new_head = (new_x, new_y)
+        eating = self.food is not None and new_head == self.food
+        grows = eating or self.grow_pending > 0
+        if self._occupied[new_y * self.grid_width + new_x] and (grows or new_head != body[-1]):
+            if self._history is not None:
+                self._remember(False, None, None)
             self.alive = False
             return
 
-        self.snake.insert(0, new_head)
+        if self._history is not None:
+            self._remember(True, None if grows else body[-1], self.rng.getstate() if eating else None)
+        if not grows:
+            tail_x, tail_y = body.pop()
+            self._vacate(tail_y * self.grid_width + tail_x)
+        body.appendleft(new_head)
+        self._occupy(new_y * self.grid_width + new_x)
 
-        if self.food is not None and new_head == self.food:
+        if eating:
             self.score += 1
-            self.grow_pending += 1
             self.food = self._spawn_food()
-
-        if self.grow_pending > 0:
+        elif self.grow_pending > 0:
             self.grow_pending -= 1
-        else:
-            self.snake.pop()
+
+    def enable_history(self, max_ticks: int, max_bytes: int | None = None) -> None:
+        """Keep undo records for the last ``max_ticks`` steps so ``rewind`` works.
+
+        Each record only holds what one tick changed (the popped tail plus a
+        few scalars), so memory grows with ``max_ticks`` rather than with the
+        snake's length. Oldest records are evicted once either limit is hit.
+        """
+        self._history = deque()
+        self._history_ticks = max_ticks
+        self._history_budget = max_bytes
+        self._history_bytes = 0
+
+    @property
+    def occupancy(self) -> bytearray:
+        """Live occupancy grid indexed by ``y * grid_width + x``; read-only."""
+        self._sync()
+        return self._occupied
+
+    @property
+    def history_length(self) -> int:
+        return len(self._history) if self._history is not None else 0
+
+    def rewind(self, ticks: int = 1) -> int:
+        """Undo up to ``ticks`` steps; returns how many were undone."""
+        self._sync()
+        history = self._history
+        if not history:
+            return 0
+        body = self._body
+        width = self.grid_width
+        undone = 0
+        while history and undone < ticks:
+            record = history.pop()
+            moved, tail, food, score, grow_pending, rng_state = record
+            if moved:
+                head_x, head_y = body.popleft()
+                self._vacate(head_y * width + head_x)
+                if tail is not None:
+                    body.append(tail)
+                    self._occupy(tail[1] * width + tail[0])
+            if rng_state is not None:
+                self.rng.setstate(rng_state)
+            self.food = food
+            self.score = score
+            self.grow_pending = grow_pending
+            self.alive = True
+            self._history_bytes -= self._record_bytes(record)
+            undone += 1
+        if len(body) > 1:
+            self.direction = (body[0][0] - body[1][0], body[0][1] - body[1][1])
+        return undone
+
+    def _remember(self, moved: bool, tail: tuple[int, int] | None, rng_state: tuple | None) -> None:
+        record = (moved, tail, self.food, self.score, self.grow_pending, rng_state)
+        history = self._history
+        history.append(record)
+        self._history_bytes += self._record_bytes(record)
+        budget = self._history_budget
+        while history and (
+            len(history) > self._history_ticks or (budget is not None and self._history_bytes > budget)
+        ):
+            self._history_bytes -= self._record_bytes(history.popleft())
+
+    def _clear_history(self) -> None:
+        if self._history is not None:
+            self._history.clear()
+            self._history_bytes = 0
+
+    @staticmethod
+    def _record_bytes(record: _Undo) -> int:
+        return _HISTORY_ENTRY_BYTES + (_RNG_STATE_BYTES if record[5] is not None else 0)
+
+    def is_safe(self, x: int, y: int) -> bool:
+        """Whether the head could move onto ``(x, y)`` next tick and survive."""
+        if not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
+            return False
+        self._sync()
+        if not self._occupied[y * self.grid_width + x]:
+            return True
+        return self.grow_pending == 0 and (x, y) == self._body[-1]
 
     def _spawn_food(self) -> tuple[int, int] | None:
-        empty = self._empty_cells()
-        if not empty:
+        # Draw the k-th free cell in row-major order, so placement depends
+        # only on the board and the rng, never on how the board was reached
+        # (a game restored with ``load`` spawns the same food as the original).
+        self._sync()
+        if not self._free_count:
             return None
-        return self.rng.choice(empty)
+        k = self.rng.choice(range(self._free_count))
+        block = 0
+        for block, free in enumerate(self._block_free):
+            if k < free:
+                break
+            k -= free
+        occupied = self._occupied
+        index = occupied.find(0, block * self._block_size)
+        for _ in range(k):
+            index = occupied.find(0, index + 1)
+        return (index % self.grid_width, index // self.grid_width)
 
     def _empty_cells(self) -> list[tuple[int, int]]:
-        body = set(self.snake)
-        return [
-            (x, y)
-            for y in range(self.grid_height)
-            for x in range(self.grid_width)
-            if (x, y) not in body
+        self._sync()
+        width = self.grid_width
+        return [(index % width, index // width) for index, cell in enumerate(self._occupied) if not cell]
+
+    def _occupy(self, index: int) -> None:
+        # Free cells are counted per block of the grid so food placement can
+        # skip to the right block instead of scanning every cell.
+        self._occupied[index] = 1
+        self._free_count -= 1
+        self._block_free[index // self._block_size] -= 1
+
+    def _vacate(self, index: int) -> None:
+        self._occupied[index] = 0
+        self._free_count += 1
+        self._block_free[index // self._block_size] += 1
+
+    def _sync(self) -> None:
+        # Callers may replace ``snake`` wholesale (tests and ``load`` do);
+        # the occupancy grid only has to be rebuilt when that happens.
+        if self.snake is not self._body:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        width = self.grid_width
+        self._rebuild_from_indices([y * width + x for x, y in self.snake], deque(self.snake))
+
+    def _rebuild_from_indices(self, indices: Sequence[int], body: deque[tuple[int, int]] | None = None) -> None:
+        self._clear_history()
+        cell_count = self.grid_width * self.grid_height
+        occupied = self._occupied = bytearray(cell_count)
+        for index in indices:
+            occupied[index] = 1
+        if body is None:
+            width = self.grid_width
+            body = deque((index % width, index // width) for index in indices)
+        self._body = body
+        block_size = self._block_size = max(1, math.isqrt(cell_count))
+        self._block_free = [
+            block_size - self._occupied.count(1, start, start + block_size) for start in range(0, cell_count, block_size)
         ]
+        self._block_free[-1] -= -cell_count % block_size
+        self._free_count = sum(self._block_free)
+        self.snake = self._body
 
     def snapshot(self) -> dict:
         return {
@@ -111,8 +286,102 @@ class SnakeGame:
             "grow_pending": self.grow_pending,
         }
 
-    def load(self, snapshot: dict) -> None:
+    def pack_snapshot(self) -> bytes:
+        """Serialize the game into the compact binary form ``load`` accepts."""
+        width = self.grid_width
+        cells = array("I", [y * width + x for x, y in self.snake])
+        if sys.byteorder == "big":
+            cells.byteswap()
+        header = _SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC,
+            width,
+            self.grid_height,
+            self.direction[0],
+            self.direction[1],
+            self._cell_index(self.food),
+            self.score,
+            self.alive,
+            self.grow_pending,
+            len(cells),
+        )
+        return header + cells.tobytes()
+
+    def pack_delta(self) -> bytes:
+        """Describe the last ``step`` as a fixed-size record for ``apply_delta``.
+
+        Deltas only chain across ``step`` calls; take a fresh ``pack_snapshot``
+        after ``reset`` or ``load``.
+        """
+        self._sync()
+        return _DELTA.pack(
+            self._cell_index(self._body[0]),
+            len(self._body),
+            self.direction[0],
+            self.direction[1],
+            self._cell_index(self.food),
+            self.score,
+            self.alive,
+            self.grow_pending,
+        )
+
+    def apply_delta(self, data: bytes) -> None:
+        head, length, dx, dy, food, score, alive, grow_pending = _DELTA.unpack(data)
+        self._sync()
+        self._clear_history()
+        if alive:
+            body = self._body
+            while len(body) >= length:
+                tail_x, tail_y = body.pop()
+                self._vacate(tail_y * self.grid_width + tail_x)
+            body.appendleft((head % self.grid_width, head // self.grid_width))
+            self._occupy(head)
+        self.direction = (dx, dy)
+        self.food = self._cell_position(food)
+        self.score = score
+        self.alive = alive
+        self.grow_pending = grow_pending
+
+    def _cell_index(self, cell: tuple[int, int] | None) -> int:
+        if cell is None:
+            return -1
+        return cell[1] * self.grid_width + cell[0]
+
+    def _cell_position(self, index: int) -> tuple[int, int] | None:
+        if index < 0:
+            return None
+        return (index % self.grid_width, index // self.grid_width)
+
+    def _load_packed(self, data: bytes) -> None:
+        magic, width, height, dx, dy, food, score, alive, grow_pending, length = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("Not a packed SnakeGame snapshot")
+        if (width, height) != (self.grid_width, self.grid_height):
+            raise ValueError(f"Snapshot is for a {width}x{height} grid, not {self.grid_width}x{self.grid_height}")
+        start = _SNAPSHOT_HEADER.size
+        end = start + length * 4
+        if len(data) < end:
+            raise ValueError(f"Snapshot is truncated: {length} body cells need {end} bytes, got {len(data)}")
+        # Read the cell indices in place rather than unpacking them into
+        # tuples; the occupancy grid is filled straight from them and the
+        # body's coordinates are derived once.
+        if sys.byteorder == "little":
+            cells = memoryview(data)[start:end].cast("I")
+        else:
+            cells = array("I", bytes(data[start:end]))
+            cells.byteswap()
+        self._rebuild_from_indices(cells)
+        self.direction = (dx, dy)
+        self.food = self._cell_position(food)
+        self.score = score
+        self.alive = alive
+        self.grow_pending = grow_pending
+
+    def load(self, snapshot: dict | bytes) -> None:
+        if isinstance(snapshot, (bytes, bytearray, memoryview)):
+            self._load_packed(snapshot)
+            return
         self.snake = list(snapshot["snake"])
+        self._rebuild()
         self.direction = tuple(snapshot["direction"])
         self.food = snapshot["food"]
         self.score = int(snapshot["score"])
@@ -120,4 +389,225 @@ class SnakeGame:
         self.grow_pending = int(snapshot["grow_pending"])
 
 
-__all__ = ["SnakeGame"]
+@dataclass
+class ArenaSnake:
+    body: deque[tuple[int, int]]
+    direction: Direction
+    alive: bool = True
+    score: int = 0
+    grow_pending: int = 0
+
+    def set_direction(self, direction: Direction) -> None:
+        if not _is_opposite(direction, self.direction):
+            self.direction = direction
+
+
+@dataclass
+class SnakeArena:
+    """Many snakes sharing one grid, moved simultaneously each tick.
+
+    ``_owner`` maps every cell (``y * grid_width + x``) to the index + 1 of the
+    snake whose body covers it, so each head is checked against every other
+    body in O(1). All tails move first, then a head dies on a wall or any
+    remaining body cell (which covers head swaps, as each head lands on the
+    other's neck), and heads meeting on one cell leave only a strictly longer
+    snake alive. Dead snakes are cleared from the board at the end of the tick.
+    """
+
+    grid_width: int
+    grid_height: int
+    rng: random.Random
+    snakes: list[ArenaSnake]
+    food: set[tuple[int, int]]
+    food_count: int
+    _owner: list[int] = field(init=False, repr=False, compare=False)
+    _free: list[int] = field(init=False, repr=False, compare=False)
+    _free_slot: list[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        cell_count = self.grid_width * self.grid_height
+        self._owner = [0] * cell_count
+        for number, snake in enumerate(self.snakes, start=1):
+            for x, y in snake.body:
+                self._owner[y * self.grid_width + x] = number
+        self._free = [index for index in range(cell_count) if not self._owner[index]]
+        self._free_slot = [-1] * cell_count
+        for slot, index in enumerate(self._free):
+            self._free_slot[index] = slot
+        for x, y in self.food:
+            self._take(y * self.grid_width + x)
+        self._spawn_food()
+
+    @classmethod
+    def create(
+        cls,
+        grid_width: int,
+        grid_height: int,
+        snake_count: int,
+        food_count: int | None = None,
+        rng: random.Random | None = None,
+    ) -> "SnakeArena":
+        if rng is None:
+            rng = random.Random()
+        slots = cls._start_slots(grid_width, grid_height)
+        if len(slots) < snake_count:
+            raise ValueError(f"A {grid_width}x{grid_height} arena only fits {len(slots)} snakes")
+        rng.shuffle(slots)
+        snakes = [
+            ArenaSnake(body=deque([(x, y), (x - 1, y), (x - 2, y)]), direction=(1, 0))
+            for x, y in slots[:snake_count]
+        ]
+        if food_count is None:
+            food_count = max(1, snake_count // 2)
+        return cls(grid_width, grid_height, rng, snakes, set(), food_count)
+
+    @classmethod
+    def capacity(cls, grid_width: int, grid_height: int) -> int:
+        return len(cls._start_slots(grid_width, grid_height))
+
+    @staticmethod
+    def _start_slots(grid_width: int, grid_height: int) -> list[tuple[int, int]]:
+        # Every start slot is a three-cell snake facing right with two clear
+        # cells ahead of it, on every other row.
+        return [(x, y) for y in range(0, grid_height, 2) for x in range(2, grid_width - 2, 5)]
+
+    def is_safe(self, x: int, y: int) -> bool:
+        """Whether a head could move onto ``(x, y)`` without hitting a wall or body.
+
+        A tail counts as safe when its snake is not growing, since it moves
+        away this tick; other heads moving onto the same cell are not considered.
+        """
+        if not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
+            return False
+        owner = self._owner[y * self.grid_width + x]
+        if not owner:
+            return True
+        snake = self.snakes[owner - 1]
+        return snake.body[-1] == (x, y) and snake.grow_pending == 0
+
+    def owner(self, x: int, y: int) -> int | None:
+        owner = self._owner[y * self.grid_width + x]
+        return owner - 1 if owner else None
+
+    def step(self) -> None:
+        width = self.grid_width
+        owner = self._owner
+        moves: list[tuple[int, ArenaSnake, tuple[int, int], bool]] = []
+        dying: list[ArenaSnake] = []
+        for number, snake in enumerate(self.snakes, start=1):
+            if not snake.alive:
+                continue
+            head_x, head_y = snake.body[0]
+            new_x = head_x + snake.direction[0]
+            new_y = head_y + snake.direction[1]
+            if not (0 <= new_x < width and 0 <= new_y < self.grid_height):
+                dying.append(snake)
+                continue
+            new_head = (new_x, new_y)
+            moves.append((number, snake, new_head, new_head in self.food))
+
+        for _, snake, _, eating in moves:
+            if not eating and snake.grow_pending == 0:
+                tail_x, tail_y = snake.body.pop()
+                owner[tail_y * width + tail_x] = 0
+                self._put(tail_y * width + tail_x)
+
+        arrivals: dict[tuple[int, int], list[ArenaSnake]] = {}
+        for _, snake, new_head, _ in moves:
+            arrivals.setdefault(new_head, []).append(snake)
+
+        for number, snake, new_head, eating in moves:
+            contenders = arrivals[new_head]
+            if owner[new_head[1] * width + new_head[0]]:
+                dying.append(snake)
+            elif len(contenders) > 1 and any(
+                len(other.body) >= len(snake.body) for other in contenders if other is not snake
+            ):
+                dying.append(snake)
+            else:
+                snake.body.appendleft(new_head)
+                owner[new_head[1] * width + new_head[0]] = number
+                self._take(new_head[1] * width + new_head[0])
+                if eating:
+                    snake.score += 1
+                    self.food.discard(new_head)
+                elif snake.grow_pending > 0:
+                    snake.grow_pending -= 1
+
+        for snake in dying:
+            snake.alive = False
+            for x, y in snake.body:
+                index = y * width + x
+                if owner[index] and self.snakes[owner[index] - 1] is snake:
+                    owner[index] = 0
+                    self._put(index)
+        self._spawn_food()
+
+    def _spawn_food(self) -> None:
+        while len(self.food) < self.food_count and self._free:
+            index = self.rng.choice(self._free)
+            self._take(index)
+            self.food.add((index % self.grid_width, index // self.grid_width))
+
+    def _take(self, index: int) -> None:
+        slot = self._free_slot[index]
+        if slot < 0:
+            return
+        last = self._free.pop()
+        if last != index:
+            self._free[slot] = last
+            self._free_slot[last] = slot
+        self._free_slot[index] = -1
+
+    def _put(self, index: int) -> None:
+        if self._free_slot[index] < 0:
+            self._free_slot[index] = len(self._free)
+            self._free.append(index)
+
+
+@dataclass
+class TurnQueue:
+    """Turn key presses waiting to be applied, at most one per tick.
+
+    Presses are validated against the direction the snake will be facing once
+    everything already queued has been applied: repeats of it and reversals
+    of it are dropped on arrival, as are presses beyond ``capacity``. Presses
+    older than ``max_age`` seconds when their tick comes round are stale (the
+    game was paused, say) and are skipped.
+    """
+
+    capacity: int = 3
+    max_age: float | None = 0.5
+    dropped: int = 0
+    _turns: deque[tuple[float, Direction]] = field(default_factory=deque, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def push(self, direction: Direction, current: Direction, now: float) -> bool:
+        last = self._turns[-1][1] if self._turns else current
+        if direction == last or _is_opposite(direction, last) or len(self._turns) >= self.capacity:
+            self.dropped += 1
+            return False
+        self._turns.append((now, direction))
+        return True
+
+    def pop(self, current: Direction, now: float) -> Direction | None:
+        """The next turn to apply this tick, or None to keep going straight."""
+        turns = self._turns
+        while turns:
+            pressed, direction = turns.popleft()
+            if self.max_age is not None and now - pressed > self.max_age:
+                self.dropped += 1
+                continue
+            if direction == current or _is_opposite(direction, current):
+                self.dropped += 1
+                continue
+            return direction
+        return None
+
+    def clear(self) -> None:
+        self._turns.clear()
+
+
+__all__ = ["ArenaSnake", "SnakeArena", "SnakeGame", "TurnQueue"]
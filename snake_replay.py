@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import argparse
+import bisect
+from dataclasses import dataclass
+import json
+import random
+import sys
+import time
+from typing import BinaryIO
+
+from snake_logic import Direction, SnakeGame
+
+
+# A replay file is JSON lines: a header object with the seed and grid size,
+# then one ``[tick, dx, dy]`` line per ``set_direction`` call, where ``tick``
+# counts the ``step`` calls made before the direction was set.
+
+
+class ReplayWriter:
+    def __init__(self, path: str, seed: int, grid_width: int, grid_height: int):
+        self.file = open(path, "w")
+        self.last_tick = 0
+        header = {"seed": seed, "grid_width": grid_width, "grid_height": grid_height}
+        self.file.write(json.dumps(header) + "\n")
+
+    def record(self, tick: int, direction: Direction) -> None:
+        if tick < self.last_tick:
+            raise ValueError(f"Replay inputs must be recorded in tick order ({tick} < {self.last_tick})")
+        self.last_tick = tick
+        self.file.write(json.dumps([tick, direction[0], direction[1]]) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class _Keyframe:
+    tick: int
+    snapshot: bytes
+    rng_state: tuple
+    offset: int
+    pending: tuple[int, Direction] | None
+
+
+class Replayer:
+    """Rebuilds a recorded game by driving ``SnakeGame.step`` headlessly.
+
+    Inputs are streamed from disk, so only the current line and the keyframes
+    are held in memory. A keyframe (packed snapshot, rng state and file
+    offset) is taken every ``keyframe_interval`` ticks on the way forward;
+    ``seek`` restarts from the nearest one instead of from tick zero.
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = 1024):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.file: BinaryIO = open(path, "rb")
+        header = json.loads(self.file.readline())
+        self.seed = header["seed"]
+        self.grid_width = header["grid_width"]
+        self.grid_height = header["grid_height"]
+        self.game = SnakeGame.create(self.grid_width, self.grid_height, random.Random(self.seed))
+        self.tick = 0
+        self._pending = self._read_event()
+        self._keyframes: list[_Keyframe] = [self._keyframe()]
+        self._keyframe_ticks = [0]
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "Replayer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def step(self) -> bool:
+        """Advance one tick; returns False once the game is over."""
+        if not self.game.alive:
+            return False
+        while self._pending is not None and self._pending[0] <= self.tick:
+            self.game.set_direction(self._pending[1])
+            self._pending = self._read_event()
+        self.game.step()
+        self.tick += 1
+        if self.tick % self.keyframe_interval == 0 and self.tick > self._keyframe_ticks[-1]:
+            self._keyframes.append(self._keyframe())
+            self._keyframe_ticks.append(self.tick)
+        return self.game.alive
+
+    def run(self) -> SnakeGame:
+        """Fast-forward to the end of the game."""
+        while self.step():
+            pass
+        return self.game
+
+    def seek(self, tick: int) -> SnakeGame:
+        """Move to ``tick`` (or the end of the game, if it ends sooner)."""
+        nearest = self._keyframes[bisect.bisect_right(self._keyframe_ticks, tick) - 1]
+        if not (nearest.tick <= self.tick <= tick):
+            self._restore(nearest)
+        while self.tick < tick and self.step():
+            pass
+        return self.game
+
+    def _keyframe(self) -> _Keyframe:
+        return _Keyframe(self.tick, self.game.pack_snapshot(), self.game.rng.getstate(), self.file.tell(), self._pending)
+
+    def _restore(self, keyframe: _Keyframe) -> None:
+        self.game.load(keyframe.snapshot)
+        self.game.rng.setstate(keyframe.rng_state)
+        self.file.seek(keyframe.offset)
+        self._pending = keyframe.pending
+        self.tick = keyframe.tick
+
+    def _read_event(self) -> tuple[int, Direction] | None:
+        line = self.file.readline()
+        if not line.strip():
+            return None
+        tick, dx, dy = json.loads(line)
+        return tick, (dx, dy)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded Snake game as fast as possible.")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, help="stop at this tick instead of the end of the game")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with Replayer(args.path) as replayer:
+        game = replayer.seek(args.seek) if args.seek is not None else replayer.run()
+        elapsed = time.perf_counter() - started
+        print(f"tick={replayer.tick} score={game.score} length={len(game.snake)} alive={game.alive}")
+        print(f"{replayer.tick / max(elapsed, 1e-9):.0f} ticks/s")
+    return 0
+
+
+__all__ = ["ReplayWriter", "Replayer"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+import importlib
+import json
+import os
+import random
+import sys
+from typing import Callable, Iterable, Iterator
+
+from snake_autopilot import autopilot_policy
+from snake_bots import greedy_policy, random_policy
+from snake_logic import Direction, SnakeGame
+
+
+Policy = Callable[[SnakeGame, random.Random], Direction]
+
+POLICIES: dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "autopilot": autopilot_policy,
+}
+
+
+def load_policy(spec: str) -> Policy:
+    """Resolve a built-in policy name or a ``module:function`` path."""
+    if spec in POLICIES:
+        return POLICIES[spec]
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown policy {spec!r}; use one of {sorted(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+@dataclass
+class GameResult:
+    seed: int
+    score: int
+    length: int
+    ticks: int
+    death_cause: str
+
+
+def _death_cause(game: SnakeGame) -> str:
+    # ``step`` leaves the board untouched on death, so the fatal move can be
+    # recomputed from the current head and direction.
+    head_x, head_y = game.snake[0]
+    x = head_x + game.direction[0]
+    y = head_y + game.direction[1]
+    if not (0 <= x < game.grid_width and 0 <= y < game.grid_height):
+        return "wall"
+    return "self"
+
+
+def run_game(seed: int, grid_width: int, grid_height: int, policy_spec: str, max_ticks: int) -> GameResult:
+    policy = load_policy(policy_spec)
+    game = SnakeGame.create(grid_width, grid_height, random.Random(seed))
+    policy_rng = random.Random(seed ^ 0x5EED)
+    ticks = 0
+    while game.alive and ticks < max_ticks:
+        if game.food is None:
+            break
+        game.set_direction(policy(game, policy_rng))
+        game.step()
+        ticks += 1
+    if not game.alive:
+        cause = _death_cause(game)
+    elif game.food is None:
+        cause = "full"
+    else:
+        cause = "timeout"
+    return GameResult(seed, game.score, len(game.snake), ticks, cause)
+
+
+def _run_chunk(args: tuple[list[int], int, int, str, int]) -> list[GameResult]:
+    seeds, grid_width, grid_height, policy_spec, max_ticks = args
+    return [run_game(seed, grid_width, grid_height, policy_spec, max_ticks) for seed in seeds]
+
+
+def simulate(
+    seeds: Iterable[int],
+    grid_width: int,
+    grid_height: int,
+    policy_spec: str = "greedy",
+    max_ticks: int = 10_000,
+    workers: int | None = None,
+    chunk_size: int = 64,
+) -> Iterator[GameResult]:
+    """Run one game per seed across a process pool, streaming results in seed order."""
+    load_policy(policy_spec)
+    seeds = list(seeds)
+    chunks = [
+        (seeds[i : i + chunk_size], grid_width, grid_height, policy_spec, max_ticks)
+        for i in range(0, len(seeds), chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(_run_chunk, chunks):
+            yield from results
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(results: Iterable[GameResult]) -> dict:
+    results = list(results)
+    summary: dict = {"games": len(results)}
+    for key in ("score", "length", "ticks"):
+        values = sorted(getattr(result, key) for result in results)
+        summary[key] = {
+            "mean": sum(values) / len(values) if values else 0.0,
+            "p50": percentile(values, 0.50),
+            "p90": percentile(values, 0.90),
+            "p99": percentile(values, 0.99),
+            "max": values[-1] if values else 0,
+        }
+    summary["death_cause"] = dict(Counter(result.death_cause for result in results))
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run headless Snake games across all cores.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="first seed; games use seed..seed+games-1")
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--policy", default="greedy", help="built-in name or module:function")
+    parser.add_argument("--max-ticks", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--results", help="stream per-game results to this JSONL file")
+    args = parser.parse_args(argv)
+
+    stream = open(args.results, "w") if args.results else None
+    results = []
+    try:
+        for result in simulate(
+            range(args.seed, args.seed + args.games),
+            args.width,
+            args.height,
+            args.policy,
+            args.max_ticks,
+            args.workers,
+            args.chunk_size,
+        ):
+            results.append(result)
+            if stream:
+                stream.write(json.dumps(asdict(result)) + "\n")
+    finally:
+        if stream:
+            stream.close()
+    json.dump(summarize(results), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+__all__ = ["GameResult", "POLICIES", "load_policy", "run_game", "simulate", "summarize"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from assets import AssetLoader
+from cutscene import Screen, ScreenManager
+import tutorial_mana1
+
+
+def _write_png(directory, name, color):
+    path = os.path.join(directory, name)
+    image = pygame.Surface((4, 3))
+    image.fill(color)
+    pygame.image.save(image, path)
+    return path
+
+
+class AssetLoaderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((16, 16))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = _write_png(self.directory.name, "red.png", (255, 0, 0))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _pump_until_ready(self, loader, path):
+        deadline = time.monotonic() + 5.0
+        while not loader.is_ready(path) and time.monotonic() < deadline:
+            loader.pump(budget=1.0)
+            time.sleep(0.001)
+
+    def test_preloaded_image_is_converted_by_pump(self):
+        loader = AssetLoader()
+        loader.preload([self.path])
+        self._pump_until_ready(loader, self.path)
+        self.assertEqual(loader.pending, 0)
+        image = loader.image(self.path)
+        self.assertEqual(image.get_size(), (4, 3))
+        self.assertEqual(tuple(image.get_at((0, 0)))[:3], (255, 0, 0))
+        self.assertIs(loader.image(self.path), image)
+        loader.shutdown()
+
+    def test_image_loads_synchronously_without_preload(self):
+        loader = AssetLoader()
+        self.assertEqual(loader.image(self.path).get_size(), (4, 3))
+        loader.discard([self.path])
+        self.assertFalse(loader.is_ready(self.path))
+
+    def test_switch_preloads_upcoming_screen_assets(self):
+        manager = ScreenManager()
+
+        class First(Screen):
+            def upcoming(self):
+                return ("second",)
+
+        manager.add("first", lambda: First(manager))
+        manager.add("second", lambda: Screen(manager), assets=[self.path])
+        manager.switch("first")
+        self.assertTrue(manager.assets.pending or manager.assets.is_ready(self.path))
+        self._pump_until_ready(manager.assets, self.path)
+        self.assertTrue(manager.assets.is_ready(self.path))
+        manager.quit()
+
+    def test_releasing_a_screen_keeps_assets_shared_with_resident_screens(self):
+        shared = _write_png(self.directory.name, "shared.png", (0, 0, 255))
+        manager = ScreenManager(max_resident=1)
+        manager.add("a", lambda: Screen(manager), assets=[self.path, shared])
+        manager.add("b", lambda: Screen(manager), assets=[shared])
+        manager.switch("a")
+        manager.assets.image(self.path)
+        manager.assets.image(shared)
+        manager.switch("b")
+        self.assertEqual(set(manager.screens), {"b"})
+        self.assertFalse(manager.assets.is_ready(self.path))
+        self.assertTrue(manager.assets.is_ready(shared))
+        manager.quit()
+
+    def test_tutorial_screens_declare_the_images_they_load(self):
+        pygame.font.init()
+        font = pygame.font.Font(None, 20)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for number in (1, 2, 3, 5):
+            screen_class = getattr(tutorial_mana1, f"TutorialManaScreen{number}")
+            with self.subTest(screen_class.__name__):
+                manager = ScreenManager()
+                loaded = []
+                image = manager.assets.image
+                manager.assets.image = lambda path: loaded.append(path) or image(os.path.join(root, path))
+                screen_class(manager, font)
+                self.assertEqual(sorted(loaded), sorted(screen_class.assets))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+import pygame
+
+from cutscene import CircleEffect
+
+
+def _reference(radius, color, alpha):
+    surface = pygame.Surface((80, 80))
+    surface.fill((20, 30, 40))
+    circle = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(circle, (*color, alpha), (radius, radius), radius)
+    surface.blit(circle, (5, 5))
+    return pygame.image.tobytes(surface, "RGB")
+
+
+class CircleEffectTests(unittest.TestCase):
+    def setUp(self):
+        CircleEffect._sprites.clear()
+
+    def test_cached_sprite_matches_fresh_rasterisation(self):
+        effect = CircleEffect(30, (200, 180, 40))
+        for alpha in (0, 1, 77, 128, 254, 255):
+            surface = pygame.Surface((80, 80))
+            surface.fill((20, 30, 40))
+            effect.draw(surface, (35.7, 35.2), alpha)
+            self.assertEqual(pygame.image.tobytes(surface, "RGB"), _reference(30, (200, 180, 40), alpha), alpha)
+        self.assertEqual(len(CircleEffect._sprites), 1)
+
+    def test_sprite_cache_is_bounded(self):
+        surface = pygame.Surface((80, 80))
+        for radius in range(1, CircleEffect.sprite_cache_size + 6):
+            CircleEffect(radius, (255, 0, 0)).draw(surface, (40, 40), 255)
+        self.assertEqual(len(CircleEffect._sprites), CircleEffect.sprite_cache_size)
+        self.assertNotIn((1, (255, 0, 0)), CircleEffect._sprites)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import cutscene_script
+from cutscene_script import ScriptError, compile_script, load_plan
+
+
+SCRIPT = {
+    "marks": {"appear": 1.0, "arrive": "appear + 2 * 1.5"},
+    "actors": [{"name": "dot", "radius": 10, "color": [1, 2, 3], "y": "center_y"}],
+    "tracks": [
+        {"actor": "dot", "property": "x", "keys": [["appear", "radius"], ["arrive", "width - radius", "ease_in"]]},
+    ],
+    "triggers": [{"at": "arrive + 1", "switch": "next"}],
+}
+
+
+class CompileScriptTests(unittest.TestCase):
+    def test_compiles_to_flat_tracks_with_defaults(self):
+        plan = compile_script(SCRIPT)
+        self.assertEqual([track.name for track in plan.tracks], ["dot.x", "dot.y", "dot.alpha"])
+        self.assertEqual(plan.tracks[0].times, [1.0, 4.0])
+        self.assertEqual(plan.triggers, [(5.0, "next")])
+
+        switched = []
+        timeline = plan.build_timeline(200, 100, switched.append)
+        timeline.advance(2.5)
+        self.assertEqual(timeline.values["dot.x"], 10 + 180 * 0.25)
+        self.assertEqual((timeline.values["dot.y"], timeline.values["dot.alpha"]), (50.0, 255.0))
+        timeline.advance(3.0)
+        self.assertEqual(switched, ["next"])
+
+    def test_rejects_invalid_scripts(self):
+        bad_scripts = [
+            dict(SCRIPT, marks={"appear": "later + 1"}),
+            dict(SCRIPT, marks={"appear": "__import__('os')"}),
+            dict(SCRIPT, marks={"appear": "(1).real"}),
+            dict(SCRIPT, actors=[{"name": "dot", "radius": 0, "color": [1, 2, 3]}]),
+            dict(SCRIPT, actors=[{"name": "dot", "radius": 10, "color": [1, 2, 300]}]),
+            dict(SCRIPT, tracks=[{"actor": "ghost", "property": "x", "keys": [[0, 0]]}]),
+            dict(SCRIPT, tracks=[{"actor": "dot", "property": "x", "keys": [[0, 0, "bounce"]]}]),
+            dict(SCRIPT, tracks=[{"actor": "dot", "property": "x", "keys": [[0, "appear"]]}]),
+            dict(SCRIPT, triggers=[{"at": 1}]),
+            dict(SCRIPT, marks={"appear": "1/0"}),
+            dict(SCRIPT, tracks=[{"actor": "dot", "property": "x", "keys": [[0, "radius / (height - 600)"]]}]),
+            dict(SCRIPT, scenes=[]),
+        ]
+        for script in bad_scripts:
+            with self.subTest(script=script), self.assertRaises(ScriptError):
+                compile_script(script)
+
+    def test_layout_errors_name_their_location(self):
+        script = dict(SCRIPT, tracks=[{"actor": "dot", "property": "x", "keys": [[0, "width / (height - 300)"]]}])
+        plan = compile_script(script)
+        with self.assertRaisesRegex(ScriptError, r"tracks\[0\]\.keys\[0\]"):
+            plan.build_timeline(640, 300, lambda target: None)
+
+
+class LoadPlanTests(unittest.TestCase):
+    def test_plan_is_cached_until_script_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene.json")
+            cache = os.path.join(directory, "cache")
+            with open(path, "w") as f:
+                json.dump(SCRIPT, f)
+            plan = load_plan(path, cache)
+            self.assertEqual(len(os.listdir(cache)), 1)
+            with mock.patch.object(cutscene_script, "compile_script", side_effect=AssertionError("recompiled")):
+                cached = load_plan(path, cache)
+            self.assertEqual(cached.to_data()[1:], plan.to_data()[1:])
+            self.assertEqual(cached.build_timeline(200, 100, print).values, plan.build_timeline(200, 100, print).values)
+
+            with open(path, "w") as f:
+                json.dump(dict(SCRIPT, background=[9, 9, 9]), f)
+            self.assertEqual(load_plan(path, cache).background, (9, 9, 9))
+            self.assertEqual(len(os.listdir(cache)), 1)
+
+    def test_toml_scripts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene.toml")
+            with open(path, "w") as f:
+                f.write('triggers = [{at = 2.5, switch = "next"}]\n')
+            self.assertEqual(load_plan(path, directory).triggers, [(2.5, "next")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from cutscene import Screen, ScreenManager
+from frame_stats import FrameStats
+
+
+class FrameStatsTests(unittest.TestCase):
+    def test_percentiles_over_rolling_window(self):
+        stats = FrameStats(window=100)
+        for ms in range(1, 201):
+            stats.record("game", "render", ms / 1000)
+        (row,) = stats.summary()
+        self.assertEqual((row["screen"], row["phase"], row["frames"]), ("game", "render", 100))
+        self.assertAlmostEqual(row["p50_ms"], 150)
+        self.assertAlmostEqual(row["p95_ms"], 195)
+        self.assertAlmostEqual(row["p99_ms"], 199)
+
+    def test_manager_records_update_and_render_per_screen(self):
+        manager = ScreenManager()
+        manager.add("a", Screen(manager))
+        manager.switch("a")
+        manager.update(0.016)
+        manager.render(None)
+        manager.record("flip", 0.001)
+        self.assertEqual(manager.stats, None)
+        manager.stats = FrameStats()
+        manager.update(0.016)
+        manager.render(None)
+        manager.record("flip", 0.001)
+        phases = [(row["screen"], row["phase"]) for row in manager.stats.summary()]
+        self.assertEqual(phases, [("a", "update"), ("a", "render"), ("a", "flip")])
+
+    def test_dump_csv_and_json(self):
+        stats = FrameStats()
+        stats.record("menu", "event", 0.002)
+        stats.record("menu", "flip", 0.004)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "frames.csv")
+            json_path = os.path.join(directory, "frames.json")
+            stats.dump(csv_path)
+            stats.dump(json_path)
+            with open(csv_path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            with open(json_path) as f:
+                self.assertEqual(json.load(f), stats.summary())
+        self.assertEqual([row["phase"] for row in rows], ["event", "flip"])
+        self.assertAlmostEqual(float(rows[1]["p99_ms"]), 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
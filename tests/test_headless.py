@@ -0,0 +1,136 @@
+import os
+import random
+import tempfile
+import unittest
+
+import pygame
+
+import headless
+from snake_replay import Replayer, ReplayWriter
+
+
+class HeadlessTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.font = headless.init((320, 240))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def test_runs_scripted_snake_frames(self):
+        manager = headless.build_manager(self.font)
+        script = headless.parse_keys(["2:down", "4:left"])
+        result = headless.run_screen(manager, "snake", 30, (320, 240), script)
+        self.assertEqual(result["frames"], 30)
+        self.assertGreater(result["fps"], 0)
+        phases = {(row["screen"], row["phase"]): row for row in result["phases"]}
+        self.assertEqual(phases["snake", "render"]["frames"], 30)
+        self.assertEqual(phases["snake", "event"]["frames"], 2)
+        self.assertEqual(manager.active.game.direction, (-1, 0))
+
+    def test_cutscene_hands_over_when_its_timeline_ends(self):
+        manager = headless.build_manager(self.font)
+        headless.run_screen(manager, "CutScene1", 60 * 24, (320, 240))
+        self.assertEqual(manager.active_name, "CutScene1")
+        headless.run_screen(manager, "CutScene1", 60 * 25, (320, 240))
+        self.assertEqual(manager.active_name, "TutorialTextScreen1")
+
+    def test_render_at_matches_playing_up_to_that_moment(self):
+        manager = headless.build_manager(self.font)
+        surface = pygame.Surface((320, 240))
+        manager.switch("CutScene1")
+        cutscene = manager.active
+        for time in (1.5, 9.0, 11.25, 21.0, 22.0):
+            while cutscene.timeline.time < time:
+                cutscene.timeline.advance(0.25)
+            cutscene.render(surface)
+            played = pygame.image.tobytes(surface, "RGB")
+            direct = headless.render_at(headless.build_manager(self.font), "CutScene1", time, (320, 240))
+            self.assertEqual(pygame.image.tobytes(direct, "RGB"), played, time)
+
+    def test_cutscene_scrub_and_skip(self):
+        manager = headless.build_manager(self.font)
+        manager.switch("CutScene1")
+        cutscene = manager.active
+        right = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
+        left = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
+        manager.handle_event(right)
+        manager.handle_event(right)
+        manager.handle_event(left)
+        self.assertAlmostEqual(cutscene.timeline.time, 2.0)
+        manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        manager.update(1.0)
+        self.assertAlmostEqual(cutscene.timeline.time, 2.0)
+        manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+        self.assertEqual(manager.active_name, "TutorialTextScreen1")
+
+    def test_incremental_snake_frames_match_full_redraw(self):
+        keys = [pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT]
+        for cell_size in (24, 10, 6, 4):
+            with self.subTest(cell_size=cell_size):
+                manager = headless.build_manager(self.font)
+                manager.switch("snake")
+                screen = manager.active
+                screen.cell_size = cell_size
+                surface = pygame.Surface((320, 240))
+                manager.render(surface)
+                policy = random.Random(cell_size)
+                for frame in range(240):
+                    if frame % 4 == 0:
+                        manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=policy.choice(keys)))
+                    if not screen.game.alive:
+                        manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+                    manager.update(1 / 20)
+                    manager.render(surface)
+                    full = surface.copy()
+                    screen._full_redraw = True
+                    screen.render(full)
+                    self.assertEqual(pygame.image.tobytes(surface, "RGB"), pygame.image.tobytes(full, "RGB"), frame)
+
+    def test_snake_games_are_recorded_for_replay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            writers = []
+
+            def recorder(seed, grid_width, grid_height):
+                path = os.path.join(directory, f"{len(writers)}.jsonl")
+                writers.append((path, seed, ReplayWriter(path, seed, grid_width, grid_height)))
+                return writers[-1][2]
+
+            manager = headless.build_manager(self.font)
+            manager.switch("snake")
+            screen = manager.active
+            screen.recorder = recorder
+            surface = pygame.Surface((320, 240))
+            keys = [pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT]
+            policy = random.Random(5)
+            games = []
+            for frame in range(600):
+                if frame % 3 == 0:
+                    manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=policy.choice(keys)))
+                manager.update(1 / 20)
+                manager.render(surface)
+                if not screen.game.alive:
+                    games.append((screen.tick, screen.game.snapshot()))
+                    manager.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+                    manager.render(surface)
+            games.append((screen.tick, screen.game.snapshot()))
+            screen.replay.close()
+
+            self.assertGreater(len(games), 1)
+            self.assertEqual(len(writers), len(games))
+            self.assertEqual(len({seed for _, seed, _ in writers}), len(writers))
+            for (path, _, _), (tick, snapshot) in zip(writers, games):
+                with Replayer(path) as replayer:
+                    self.assertEqual(replayer.seek(tick).snapshot(), snapshot)
+
+    def test_every_registered_screen_renders(self):
+        manager = headless.build_manager(self.font)
+        for name in sorted(manager.screens.keys() | manager.factories.keys()):
+            with self.subTest(name):
+                result = headless.run_screen(manager, name, 3, (320, 240))
+                self.assertEqual(sum(row["frames"] for row in result["phases"] if row["phase"] == "render"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
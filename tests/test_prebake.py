@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+import headless
+from prebake import FrameBaker, FrameCache, bake
+
+
+class PrebakeTests(unittest.TestCase):
+    size = (160, 120)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.font = headless.init(cls.size)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def _cutscene(self, manager=None):
+        manager = manager or headless.build_manager(self.font)
+        return manager.factories["CutScene1"]()
+
+    def test_baked_frames_match_live_rendering(self):
+        cache = bake(self._cutscene(), self.size, fps=4.0)
+        self.assertEqual(len(cache.frames), 99)
+        live = self._cutscene()
+        surface = pygame.Surface(self.size)
+        for t in (0.0, 1.5, 11.0, 21.75):
+            live.render_at(surface, t)
+            self.assertEqual(pygame.image.tobytes(cache.surface_at(t), "RGB"), pygame.image.tobytes(surface, "RGB"), t)
+
+    def test_playback_decodes_ahead_into_display_format(self):
+        cache = bake(self._cutscene(), self.size, fps=4.0)
+        cache.window = 3
+        first = cache.surface_at(5.0)
+        self.assertEqual(sorted(cache._decoded), [21, 22, 23])
+        ahead = cache._decoded[21].result(timeout=5)
+        self.assertIs(cache.surface_at(5.25), ahead)
+        self.assertEqual(ahead.get_bitsize(), pygame.display.get_surface().get_bitsize())
+        self.assertEqual(first.get_masks(), pygame.display.get_surface().get_masks())
+        cache.surface_at(1.0)
+        self.assertEqual(sorted(cache._decoded), [5, 6, 7])
+        cache.close()
+
+    def test_load_rejects_damaged_files(self):
+        cache = bake(self._cutscene(), self.size, fps=1.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene.frames")
+            cache.save(path)
+            with open(path, "rb") as f:
+                data = f.read()
+            for damaged in (data[:-10], data + b"\0"):
+                with open(path, "wb") as f:
+                    f.write(damaged)
+                with self.assertRaises(ValueError):
+                    FrameCache.load(path)
+
+    def test_baker_rebakes_corrupt_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baker = FrameBaker(directory, fps=1.0)
+            baker.request("CutScene1", self._cutscene, self.size)
+            cache = baker.wait("CutScene1", timeout=30)
+            (path,) = os.listdir(directory)
+            path = os.path.join(directory, path)
+            corrupt = FrameCache(cache.key, cache.size, cache.fps, [b"x" * len(frame) for frame in cache.frames])
+            corrupt.save(path)
+
+            reloaded = FrameBaker(directory, fps=1.0)
+            reloaded.request("CutScene1", self._cutscene, self.size)
+            self.assertEqual(reloaded.wait("CutScene1", timeout=30).frames, cache.frames)
+            self.assertEqual(FrameCache.load(path).frames, cache.frames)
+
+    def test_key_tracks_definition_and_size(self):
+        screen = self._cutscene()
+        screen.render_at(pygame.Surface(self.size), 0.0)
+        key = screen.definition_key()
+        screen.render_at(pygame.Surface((200, 120)), 0.0)
+        self.assertNotEqual(screen.definition_key(), key)
+        other = self._cutscene()
+        other.actors[-1][0].color = (250, 0, 0)
+        other.render_at(pygame.Surface(self.size), 0.0)
+        self.assertNotEqual(other.definition_key(), key)
+
+    def test_manager_plays_back_from_disk_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manager = headless.build_manager(self.font)
+            manager.baker = FrameBaker(directory, fps=2.0)
+            manager.switch("MenuScreen")
+            cache = manager.baker.wait("CutScene1", timeout=30)
+            self.assertIsNotNone(cache)
+            (path,) = os.listdir(directory)
+            self.assertEqual(FrameCache.load(os.path.join(directory, path)).frames, cache.frames)
+
+            manager.switch("CutScene1")
+            cutscene = manager.active
+            cutscene.compose = None  # playback must not compose frames live
+            surface = pygame.display.get_surface()
+            manager.update(12.0)
+            manager.render(surface)
+            self.assertEqual(
+                pygame.image.tobytes(surface, "RGB"), pygame.image.tobytes(cache.surface_at(12.0), "RGB")
+            )
+
+            reloaded = FrameBaker(directory, fps=2.0)
+            reloaded.request("CutScene1", manager.factories["CutScene1"], self.size)
+            self.assertEqual(reloaded.wait("CutScene1", timeout=30).frames, cache.frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from cutscene import Screen, ScreenManager
+
+
+class RecordingScreen(Screen):
+    built = 0
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        RecordingScreen.built += 1
+        self.entered = 0
+
+    def on_enter(self):
+        self.entered += 1
+
+
+class ScreenManagerTests(unittest.TestCase):
+    def setUp(self):
+        RecordingScreen.built = 0
+
+    def test_factories_build_on_first_switch(self):
+        manager = ScreenManager()
+        manager.add("a", lambda: RecordingScreen(manager))
+        manager.add("b", lambda: RecordingScreen(manager))
+        self.assertEqual(RecordingScreen.built, 0)
+        manager.switch("a")
+        manager.switch("a")
+        self.assertEqual(RecordingScreen.built, 1)
+        self.assertEqual(manager.active.entered, 2)
+        self.assertNotIn("b", manager.screens)
+
+    def test_least_recently_used_factory_screens_are_released(self):
+        manager = ScreenManager(max_resident=2)
+        eager = RecordingScreen(manager)
+        manager.add("eager", eager)
+        for name in ("a", "b"):
+            manager.add(name, lambda: RecordingScreen(manager))
+        manager.switch("a")
+        manager.switch("eager")
+        manager.switch("b")
+        self.assertEqual(set(manager.screens), {"eager", "b"})
+        manager.switch("a")
+        self.assertEqual(set(manager.screens), {"eager", "a"})
+        self.assertEqual(RecordingScreen.built, 4)
+
+    def test_idle_timeout_releases_inactive_screens(self):
+        manager = ScreenManager(idle_timeout=0.0)
+        manager.add("a", lambda: RecordingScreen(manager))
+        manager.add("b", lambda: RecordingScreen(manager))
+        manager.switch("a")
+        manager.switch("b")
+        self.assertEqual(set(manager.screens), {"b"})
+        self.assertEqual(manager.active_name, "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import unittest
+from collections import deque
+
+from snake_logic import ArenaSnake, SnakeArena
+
+
+def _arena(*bodies, food=()):
+    snakes = [
+        ArenaSnake(body=deque(body), direction=(body[0][0] - body[1][0], body[0][1] - body[1][1]))
+        for body in bodies
+    ]
+    return SnakeArena(10, 10, random.Random(0), snakes, set(food), len(food))
+
+
+class SnakeArenaTests(unittest.TestCase):
+    def test_create_places_snakes_apart(self):
+        arena = SnakeArena.create(40, 40, 20, rng=random.Random(1))
+        cells = [cell for snake in arena.snakes for cell in snake.body]
+        self.assertEqual(len(cells), len(set(cells)))
+        self.assertEqual(len(arena.food), 10)
+        self.assertFalse(arena.food & set(cells))
+        with self.assertRaises(ValueError):
+            SnakeArena.create(10, 4, 50)
+
+    def test_head_on_equal_length_kills_both(self):
+        arena = _arena([(2, 5), (1, 5), (0, 5)], [(4, 5), (5, 5), (6, 5)])
+        arena.step()
+        self.assertFalse(arena.snakes[0].alive)
+        self.assertFalse(arena.snakes[1].alive)
+        self.assertIsNone(arena.owner(3, 5))
+        self.assertIsNone(arena.owner(1, 5))
+
+    def test_head_on_longer_snake_wins(self):
+        arena = _arena([(2, 5), (1, 5), (0, 5), (0, 6)], [(4, 5), (5, 5), (6, 5)])
+        arena.step()
+        self.assertTrue(arena.snakes[0].alive)
+        self.assertFalse(arena.snakes[1].alive)
+        self.assertEqual(arena.owner(3, 5), 0)
+
+    def test_swap_kills_both(self):
+        arena = _arena([(3, 5), (2, 5), (1, 5)], [(4, 5), (5, 5), (6, 5)])
+        arena.step()
+        self.assertFalse(arena.snakes[0].alive)
+        self.assertFalse(arena.snakes[1].alive)
+
+    def test_head_to_body_and_following_tail(self):
+        arena = _arena([(3, 4), (3, 3), (3, 2)], [(2, 5), (3, 5), (4, 5)], [(4, 4), (5, 4), (6, 4)])
+        arena.snakes[2].direction = (0, 1)
+        self.assertTrue(arena.is_safe(4, 5))
+        self.assertFalse(arena.is_safe(3, 5))
+        arena.step()
+        self.assertFalse(arena.snakes[0].alive)
+        self.assertTrue(arena.snakes[1].alive)
+        self.assertTrue(arena.snakes[2].alive)
+        self.assertEqual(arena.owner(4, 5), 2)
+
+    def test_eating_grows_and_respawns_food(self):
+        arena = _arena([(2, 5), (1, 5), (0, 5)], food=[(3, 5), (9, 9)])
+        arena.step()
+        snake = arena.snakes[0]
+        self.assertEqual(snake.score, 1)
+        self.assertEqual(len(snake.body), 4)
+        self.assertEqual(len(arena.food), 2)
+        self.assertNotIn((3, 5), arena.food)
+        occupied = {cell for cell in snake.body} | arena.food
+        free = {(index % 10, index // 10) for index in arena._free}
+        self.assertEqual(free, {(x, y) for y in range(10) for x in range(10)} - occupied)
+
+
+if __name__ == "__main__":
+    unittest.main()
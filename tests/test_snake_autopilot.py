@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from snake_autopilot import Autopilot, _cycle_with_spare, hamiltonian_cycle
+from snake_logic import SnakeGame
+
+
+class AutopilotTests(unittest.TestCase):
+    def test_hamiltonian_cycle_visits_every_cell(self):
+        for width, height in [(8, 6), (7, 4), (4, 7), (2, 2)]:
+            cycle = hamiltonian_cycle(width, height)
+            self.assertEqual(sorted(cycle), list(range(width * height)))
+            for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+                self.assertEqual(abs(a % width - b % width) + abs(a // width - b // width), 1)
+        self.assertIsNone(hamiltonian_cycle(9, 9))
+
+    def test_fills_small_board(self):
+        game = SnakeGame.create(8, 6, random.Random(0))
+        pilot = Autopilot()
+        for _ in range(5000):
+            if not game.alive or game.food is None:
+                break
+            game.set_direction(pilot.choose(game))
+            game.step()
+        self.assertTrue(game.alive)
+        self.assertIsNone(game.food)
+        self.assertEqual(len(game.snake), 8 * 6)
+
+    def test_cycle_with_spare_on_odd_grids(self):
+        for width, height in [(9, 9), (11, 7), (3, 3), (5, 3)]:
+            cycle, spare = _cycle_with_spare(width, height)
+            self.assertEqual(sorted(cycle + [spare]), list(range(width * height)))
+            for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+                self.assertEqual(abs(a % width - b % width) + abs(a // width - b // width), 1)
+            # The spare can stand in for the cycle cell diagonally inside it.
+            inner = cycle.index((height - 2) * width + width - 2)
+            for side in (cycle[inner - 1], cycle[inner + 1]):
+                self.assertEqual(abs(spare % width - side % width) + abs(spare // width - side // width), 1)
+
+    def test_fills_odd_boards(self):
+        for width, height in [(9, 9), (11, 7)]:
+            for seed in range(3):
+                game = SnakeGame.create(width, height, random.Random(seed))
+                pilot = Autopilot()
+                pilot.prepare(width, height)
+                for _ in range(20000):
+                    if not game.alive or game.food is None:
+                        break
+                    game.set_direction(pilot.choose(game))
+                    game.step()
+                self.assertTrue(game.alive, (width, height, seed))
+                self.assertEqual(len(game.snake), width * height)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from snake_logic import SnakeGame
+
+if numpy is not None:
+    from snake_batch import BatchSnakeGame
+
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class BatchSnakeGameTests(unittest.TestCase):
+    def test_matches_scalar_games(self):
+        seeds = list(range(16))
+        batch = BatchSnakeGame.create(8, 6, seeds)
+        games = [SnakeGame.create(8, 6, random.Random(seed)) for seed in seeds]
+        policy = random.Random(99)
+        for _ in range(400):
+            actions = [policy.choice(DIRECTIONS) for _ in seeds]
+            done = batch.step(actions)
+            for i, game in enumerate(games):
+                game.set_direction(actions[i])
+                game.step()
+                self.assertEqual(bool(done[i]), not game.alive)
+                if not game.alive:
+                    game.reset()
+                self.assertEqual(batch.snapshot(i), game.snapshot())
+
+    def test_growth_on_food(self):
+        batch = BatchSnakeGame.create(8, 6, [0, 1])
+        head = int(batch.body[0, batch.head_pos[0]])
+        batch.food[0] = head + 1
+        batch.step([(1, 0), (1, 0)])
+        self.assertEqual(int(batch.score[0]), 1)
+        self.assertEqual(int(batch.length[0]), 4)
+        self.assertEqual(int(batch.length[1]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from snake_bench import compare, confirm, run_benchmarks
+
+
+class SnakeBenchTests(unittest.TestCase):
+    def test_compare_flags_slowdowns_over_threshold(self):
+        baseline = {"step[8x6,len=3]": 1e-6, "create[8x6]": 2e-5}
+        results = {"step[8x6,len=3]": 1.2e-6, "create[8x6]": 3e-5, "new[case]": 1.0}
+        regressions = compare(results, baseline, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("create[8x6]"))
+
+    def test_confirm_keeps_only_repeatable_slowdowns(self):
+        baseline = {"noisy": 1e-6, "slow": 1e-6}
+        reruns = iter([{"noisy": 1.1e-6, "slow": 3e-6}, {"noisy": 5e-6, "slow": 3.5e-6}])
+        results, regressions = confirm({"noisy": 4e-6, "slow": 4e-6}, baseline, 1.0, lambda: next(reruns), 2)
+        self.assertEqual(results, {"noisy": 1.1e-6, "slow": 3e-6})
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("slow"))
+
+    def test_runs_every_case(self):
+        results = run_benchmarks([(8, 6)], ticks=10, repeat=1, min_sample=0.0)
+        self.assertIn("create[8x6]", results)
+        self.assertIn("step[8x6,len=47]", results)
+        self.assertIn("load_packed[8x6,len=24]", results)
+        self.assertTrue(all(seconds > 0 for seconds in results.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from snake_env import BODY, FOOD, HEAD, WALL, SnakeEnv
+
+
+def _expected_board(game):
+    board = numpy.zeros((4, game.grid_height, game.grid_width), dtype=numpy.float32)
+    for x, y in game.snake:
+        board[BODY, y, x] = 1.0
+    board[HEAD, game.snake[0][1], game.snake[0][0]] = 1.0
+    if game.food is not None:
+        board[FOOD, game.food[1], game.food[0]] = 1.0
+    return board
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class SnakeEnvTests(unittest.TestCase):
+    def test_full_view_tracks_game_in_place(self):
+        env = SnakeEnv(8, 6)
+        buffer = env.reset(seed=3)
+        policy = random.Random(0)
+        for _ in range(300):
+            head_x, head_y = env.game.snake[0]
+            food_x, food_y = env.game.food
+            action = 3 if food_x > head_x else 2 if food_x < head_x else 1 if food_y > head_y else 0
+            if policy.random() < 0.2:
+                action = policy.randrange(4)
+            obs, reward, done, info = env.step(action)
+            self.assertIs(obs, buffer)
+            if done:
+                if env.game.alive:
+                    numpy.testing.assert_array_equal(obs, _expected_board(env.game))
+                buffer = env.reset(seed=info["steps"])
+                continue
+            numpy.testing.assert_array_equal(obs, _expected_board(env.game))
+
+    def test_ego_view_is_centred_on_head(self):
+        env = SnakeEnv(8, 6, view="ego", view_radius=2)
+        obs = env.reset(seed=0)
+        self.assertEqual(obs.shape, (4, 5, 5))
+        self.assertEqual(obs[HEAD, 2, 2], 1.0)
+        self.assertEqual(obs[BODY, 2, 1], 1.0)
+        for _ in range(2):
+            obs, _, _, _ = env.step(3)
+        self.assertEqual(obs[HEAD, 2, 2], 1.0)
+        self.assertTrue((obs[WALL, :, 4] == 1.0).all())
+        self.assertEqual(obs[WALL, 2, 3], 0.0)
+
+    def test_rewards(self):
+        env = SnakeEnv(8, 6)
+        env.reset(seed=0)
+        head_x, head_y = env.game.snake[0]
+        env.game.food = (head_x + 1, head_y)
+        _, reward, done, info = env.step(3)
+        self.assertEqual(reward, env.food_reward)
+        self.assertEqual(info["score"], 1)
+        for _ in range(5):
+            _, reward, done, _ = env.step(3)
+            if done:
+                break
+        self.assertTrue(done)
+        self.assertEqual(reward, env.death_reward)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,20 @@
 import random
 import unittest
 
-from snake_logic import SnakeGame
+from snake_logic import SnakeGame, TurnQueue
+
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _chase_food(game):
+    """A safe move towards the food if there is one, else any safe move."""
+    (x, y), food = game.snake[0], game.food
+    safe = [d for d in DIRECTIONS if game.is_safe(x + d[0], y + d[1])]
+    if food is not None:
+        closer = [d for d in safe if abs(food[0] - x - d[0]) + abs(food[1] - y - d[1]) < abs(food[0] - x) + abs(food[1] - y)]
+        safe = closer or safe
+    return safe[0] if safe else game.direction
 
 
 class SnakeLogicTests(unittest.TestCase):
@@ -46,6 +59,162 @@ class SnakeLogicTests(unittest.TestCase):
         self.game.step()
         self.assertFalse(self.game.alive)
 
+    def test_follows_own_tail(self):
+        self.game.snake = [(3, 3), (3, 4), (2, 4), (2, 3)]
+        self.game.direction = (-1, 0)
+        self.game.step()
+        self.assertTrue(self.game.alive)
+        self.assertEqual(list(self.game.snake), [(2, 3), (3, 3), (3, 4), (2, 4)])
+
+    def test_occupancy_matches_body(self):
+        for _ in range(20):
+            self.game.step()
+            if not self.game.alive:
+                break
+        occupied = {
+            (i % self.game.grid_width, i // self.game.grid_width)
+            for i, cell in enumerate(self.game._occupied)
+            if cell
+        }
+        self.assertEqual(occupied, set(self.game.snake))
+
+    def test_free_pool_matches_empty_cells(self):
+        self.game.food = (self.game.snake[0][0] + 1, self.game.snake[0][1])
+        for _ in range(3):
+            self.game.step()
+        body = set(self.game.snake)
+        expected = {(x, y) for y in range(6) for x in range(8)} - body
+        self.assertEqual(set(self.game._empty_cells()), expected)
+        self.assertEqual(len(self.game._empty_cells()), len(expected))
+
+    def test_food_deterministic_per_seed(self):
+        first = SnakeGame.create(8, 6, random.Random(42))
+        second = SnakeGame.create(8, 6, random.Random(42))
+        for game in (first, second):
+            head = game.snake[0]
+            game.food = (head[0] + 1, head[1])
+            game.step()
+        self.assertEqual(first.score, 1)
+        self.assertEqual(first.snapshot(), second.snapshot())
+
+    def test_loaded_game_spawns_same_food(self):
+        game = SnakeGame.create(12, 10, random.Random(3))
+        directions = []
+        for tick in range(400):
+            if not game.alive:
+                break
+            direction = _chase_food(game)
+            directions.append(direction)
+            if tick == 60:
+                packed, rng_state = game.pack_snapshot(), game.rng.getstate()
+            game.set_direction(direction)
+            game.step()
+        self.assertGreater(game.score, 8)
+
+        restored = SnakeGame.create(12, 10, random.Random(99))
+        restored.load(packed)
+        restored.rng.setstate(rng_state)
+        replay = SnakeGame.create(12, 10, random.Random(3))
+        for direction in directions[:60]:
+            replay.set_direction(direction)
+            replay.step()
+        for direction in directions[60:]:
+            for other in (restored, replay):
+                other.set_direction(direction)
+                other.step()
+            self.assertEqual(restored.snapshot(), replay.snapshot())
+        self.assertEqual(restored.snapshot(), game.snapshot())
+
+    def test_packed_snapshot_round_trip(self):
+        self.game.step()
+        packed = self.game.pack_snapshot()
+        expected = self.game.snapshot()
+        other = SnakeGame.create(8, 6, random.Random(1))
+        other.load(packed)
+        self.assertEqual(other.snapshot(), expected)
+        self.assertEqual(set(other._empty_cells()), set(self.game._empty_cells()))
+
+    def test_packed_snapshot_rejects_truncated_body(self):
+        packed = self.game.pack_snapshot()
+        with self.assertRaises(ValueError):
+            SnakeGame.create(8, 6, random.Random(1)).load(packed[:-4])
+
+    def test_packed_snapshot_rejects_other_grid(self):
+        other = SnakeGame.create(10, 10, random.Random(1))
+        with self.assertRaises(ValueError):
+            other.load(self.game.pack_snapshot())
+
+    def test_deltas_replay_steps(self):
+        mirror = SnakeGame.create(8, 6, random.Random(5))
+        mirror.load(self.game.pack_snapshot())
+        head = self.game.snake[0]
+        self.game.food = (head[0] + 1, head[1])
+        for direction in [(1, 0), (0, 1), (-1, 0), (-1, 0), (0, -1), (0, -1)]:
+            self.game.set_direction(direction)
+            self.game.step()
+            mirror.apply_delta(self.game.pack_delta())
+            self.assertEqual(mirror.snapshot(), self.game.snapshot())
+
+    def test_rewind_restores_previous_states(self):
+        self.game.enable_history(16)
+        head = self.game.snake[0]
+        self.game.food = (head[0] + 1, head[1])
+        states = [self.game.snapshot()]
+        for direction in [(1, 0), (0, 1), (-1, 0), (-1, 0), (-1, 0), (-1, 0), (-1, 0), (-1, 0)]:
+            self.game.set_direction(direction)
+            self.game.step()
+            states.append(self.game.snapshot())
+        self.assertFalse(self.game.alive)
+        self.assertEqual(self.game.rewind(), 1)
+        self.assertTrue(self.game.alive)
+        self.assertEqual(self.game.snapshot(), states[-2])
+        self.assertEqual(self.game.rewind(10), 7)
+        self.assertEqual(self.game.snapshot(), states[0])
+        self.assertEqual(self.game.rewind(), 0)
+        self.assertEqual(set(self.game._empty_cells()), {(x, y) for y in range(6) for x in range(8)} - set(self.game.snake))
+
+    def test_history_evicts_to_budget(self):
+        self.game.enable_history(3)
+        for _ in range(3):
+            self.game.step()
+        self.game.set_direction((0, 1))
+        self.game.step()
+        self.assertEqual(self.game.history_length, 3)
+        self.game.enable_history(100, max_bytes=200)
+        self.game.step()
+        self.game.step()
+        self.game.step()
+        self.assertEqual(self.game.history_length, 2)
+
+
+class TurnQueueTests(unittest.TestCase):
+    def test_two_quick_turns_apply_on_consecutive_ticks(self):
+        turns = TurnQueue()
+        self.assertTrue(turns.push((0, -1), (1, 0), 0.0))
+        self.assertTrue(turns.push((-1, 0), (1, 0), 0.01))
+        self.assertEqual(len(turns), 2)
+        self.assertEqual(turns.pop((1, 0), 0.1), (0, -1))
+        self.assertEqual(turns.pop((0, -1), 0.2), (-1, 0))
+        self.assertIsNone(turns.pop((-1, 0), 0.3))
+
+    def test_drops_redundant_reversed_and_overflowing_presses(self):
+        turns = TurnQueue(capacity=2)
+        self.assertFalse(turns.push((1, 0), (1, 0), 0.0))
+        self.assertFalse(turns.push((-1, 0), (1, 0), 0.0))
+        self.assertTrue(turns.push((0, 1), (1, 0), 0.0))
+        self.assertFalse(turns.push((0, -1), (1, 0), 0.0))
+        self.assertTrue(turns.push((1, 0), (1, 0), 0.0))
+        self.assertFalse(turns.push((0, 1), (1, 0), 0.0))
+        self.assertEqual((len(turns), turns.dropped), (2, 4))
+
+    def test_skips_stale_presses(self):
+        turns = TurnQueue(max_age=0.5)
+        turns.push((0, 1), (1, 0), 0.0)
+        self.assertIsNone(turns.pop((1, 0), 0.8))
+        self.assertEqual(turns.dropped, 1)
+        turns.push((0, -1), (1, 0), 1.0)
+        self.assertEqual(turns.pop((1, 0), 1.4), (0, -1))
+
 
 if __name__ == "__main__":
     unittest.main()
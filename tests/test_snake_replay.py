@@ -0,0 +1,73 @@
+import os
+import random
+import tempfile
+import unittest
+
+from snake_logic import SnakeGame
+from snake_replay import Replayer, ReplayWriter
+from snake_bots import greedy_policy
+
+
+class SnakeReplayTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        self.game = SnakeGame.create(10, 8, random.Random(11))
+        policy_rng = random.Random(0)
+        self.history = []
+        with ReplayWriter(self.path, 11, 10, 8) as writer:
+            tick = 0
+            while self.game.alive:
+                direction = greedy_policy(self.game, policy_rng)
+                writer.record(tick, direction)
+                self.game.set_direction(direction)
+                self.game.step()
+                tick += 1
+                self.history.append(self.game.snapshot())
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_run_reproduces_game(self):
+        with Replayer(self.path) as replayer:
+            game = replayer.run()
+            self.assertEqual(game.snapshot(), self.game.snapshot())
+            self.assertEqual(replayer.tick, len(self.history))
+
+    def test_seek_uses_keyframes(self):
+        with Replayer(self.path, keyframe_interval=4) as replayer:
+            replayer.run()
+            for tick in (len(self.history) // 2, 3, len(self.history) - 1, 9):
+                game = replayer.seek(tick)
+                self.assertEqual(game.snapshot(), self.history[tick - 1])
+
+    def test_seek_matches_sequential_replay_in_long_game(self):
+        game = SnakeGame.create(12, 10, random.Random(4))
+        policy_rng = random.Random(1)
+        history = [game.snapshot()]
+        with ReplayWriter(self.path, 4, 12, 10) as writer:
+            while game.alive:
+                direction = greedy_policy(game, policy_rng)
+                writer.record(len(history) - 1, direction)
+                game.set_direction(direction)
+                game.step()
+                history.append(game.snapshot())
+        self.assertGreater(game.score, 10)
+        self.assertGreater(len(history), 8 * 16)
+
+        order = list(range(len(history)))
+        random.Random(2).shuffle(order)
+        with Replayer(self.path, keyframe_interval=16) as replayer:
+            replayer.run()
+            for tick in order:
+                self.assertEqual(replayer.seek(tick).snapshot(), history[tick], f"seek({tick})")
+
+    def test_rejects_out_of_order_inputs(self):
+        with ReplayWriter(self.path, 0, 10, 8) as writer:
+            writer.record(5, (1, 0))
+            with self.assertRaises(ValueError):
+                writer.record(4, (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from snake_sim import GameResult, load_policy, percentile, run_game, summarize
+
+
+class SnakeSimTests(unittest.TestCase):
+    def test_run_game_is_deterministic(self):
+        first = run_game(3, 10, 10, "greedy", 500)
+        second = run_game(3, 10, 10, "greedy", 500)
+        self.assertEqual(first, second)
+        self.assertIn(first.death_cause, ("wall", "self", "full", "timeout"))
+        self.assertEqual(first.length, 3 + first.score)
+
+    def test_load_policy_by_path(self):
+        self.assertIs(load_policy("snake_sim:random_policy"), load_policy("random"))
+        with self.assertRaises(ValueError):
+            load_policy("nope")
+
+    def test_summarize_percentiles(self):
+        results = [GameResult(i, i, 3 + i, 10 * i, "wall") for i in range(101)]
+        summary = summarize(results)
+        self.assertEqual(summary["score"]["p50"], 50)
+        self.assertEqual(summary["score"]["p99"], 99)
+        self.assertEqual(summary["death_cause"], {"wall": 101})
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from timeline import Keyframe, Timeline, Track
+
+
+class TrackTests(unittest.TestCase):
+    def test_interpolates_and_holds_ends(self):
+        track = Track.from_keyframes("x", [Keyframe(2.0, 20.0), Keyframe(1.0, 10.0), Keyframe(4.0, 0.0, "step")])
+        self.assertEqual(track.sample(0.0), 10.0)
+        self.assertEqual(track.sample(1.5), 15.0)
+        self.assertEqual(track.sample(3.9), 20.0)
+        self.assertEqual(track.sample(5.0), 0.0)
+        self.assertEqual(track.sample(1.25), 12.5)
+
+    def test_easing_shapes_segment(self):
+        track = Track.from_keyframes("x", [Keyframe(0.0, 0.0), Keyframe(1.0, 100.0, "ease_in")])
+        self.assertAlmostEqual(track.sample(0.5), 25.0)
+
+    def test_rejects_unknown_easing(self):
+        with self.assertRaises(ValueError):
+            Track.from_keyframes("x", [Keyframe(0.0, 0.0, "bounce")])
+
+
+class TimelineTests(unittest.TestCase):
+    def test_advance_evaluates_tracks_and_fires_events_in_order(self):
+        timeline = Timeline()
+        fired = []
+        timeline.add_track("alpha", Keyframe(0.0, 0.0), Keyframe(1.0, 255.0))
+        timeline.add_event(0.5, lambda: fired.append(("b", timeline.values["alpha"])))
+        timeline.add_event(0.25, lambda: fired.append(("a", timeline.values["alpha"])))
+        timeline.advance(0.2)
+        self.assertEqual(fired, [])
+        timeline.advance(0.4)
+        self.assertEqual([name for name, _ in fired], ["a", "b"])
+        self.assertAlmostEqual(fired[0][1], 0.6 * 255.0)
+        timeline.advance(1.0)
+        self.assertEqual(len(fired), 2)
+        self.assertTrue(timeline.finished)
+
+    def test_seek_rearms_later_events_only(self):
+        timeline = Timeline()
+        fired = []
+        timeline.add_event(1.0, lambda: fired.append(1))
+        timeline.add_event(2.0, lambda: fired.append(2))
+        timeline.seek(1.5)
+        timeline.advance(1.0)
+        self.assertEqual(fired, [2])
+        timeline.seek(0.0)
+        timeline.advance(3.0)
+        self.assertEqual(fired, [2, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from timestep import FixedTimestep
+
+
+class FixedTimestepTests(unittest.TestCase):
+    def test_accumulates_partial_steps(self):
+        timestep = FixedTimestep(0.1)
+        self.assertEqual(timestep.advance(0.05), 0)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(0.07), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.2)
+
+    def test_long_stall_is_capped_and_dilated(self):
+        timestep = FixedTimestep(0.1, max_steps=3)
+        self.assertEqual(timestep.advance(1.05), 3)
+        self.assertAlmostEqual(timestep.dilated, 0.7)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(0.0), 0)
+
+    def test_reset_drops_partial_step(self):
+        timestep = FixedTimestep(0.1)
+        timestep.advance(0.08)
+        timestep.reset()
+        self.assertEqual(timestep.alpha, 0.0)
+        self.assertEqual(timestep.advance(0.05), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
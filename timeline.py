@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+def _linear(t: float) -> float:
+    return t
+
+
+def _ease_in(t: float) -> float:
+    return t * t
+
+
+def _ease_out(t: float) -> float:
+    return t * (2.0 - t)
+
+
+def _ease_in_out(t: float) -> float:
+    return 2.0 * t * t if t < 0.5 else 1.0 - 2.0 * (1.0 - t) * (1.0 - t)
+
+
+def _step(t: float) -> float:
+    return 1.0 if t >= 1.0 else 0.0
+
+
+EASINGS: dict[str, Callable[[float], float]] = {
+    "linear": _linear,
+    "ease_in": _ease_in,
+    "ease_out": _ease_out,
+    "ease_in_out": _ease_in_out,
+    "step": _step,
+}
+
+
+@dataclass(frozen=True)
+class Keyframe:
+    """``value`` at ``time``; ``easing`` shapes the approach from the previous keyframe."""
+
+    time: float
+    value: float
+    easing: str = "linear"
+
+
+@dataclass
+class Track:
+    """One animated value. Before the first keyframe and after the last it holds still."""
+
+    name: str
+    times: list[float]
+    values: list[float]
+    easings: list[Callable[[float], float]]
+    _cursor: int = field(default=0, repr=False)
+
+    @classmethod
+    def from_keyframes(cls, name: str, keyframes: list[Keyframe]) -> "Track":
+        if not keyframes:
+            raise ValueError(f"Track {name!r} needs at least one keyframe")
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe.time)
+        for keyframe in keyframes:
+            if keyframe.easing not in EASINGS:
+                raise ValueError(f"Unknown easing {keyframe.easing!r} on track {name!r}")
+        return cls(
+            name,
+            [keyframe.time for keyframe in keyframes],
+            [float(keyframe.value) for keyframe in keyframes],
+            [EASINGS[keyframe.easing] for keyframe in keyframes],
+        )
+
+    def sample(self, t: float) -> float:
+        times = self.times
+        last = len(times) - 1
+        if t <= times[0]:
+            return self.values[0]
+        if t >= times[last]:
+            return self.values[last]
+        # Playback moves forwards a little each frame, so the segment is
+        # almost always the cached one or the next; seeks fall back to bisect.
+        i = self._cursor
+        if not times[i] <= t < times[i + 1]:
+            if i + 2 <= last and times[i + 1] <= t < times[i + 2]:
+                i += 1
+            else:
+                i = bisect.bisect_right(times, t) - 1
+            self._cursor = i
+        start, end = times[i], times[i + 1]
+        progress = self.easings[i + 1]((t - start) / (end - start))
+        return self.values[i] + (self.values[i + 1] - self.values[i]) * progress
+
+
+class Timeline:
+    """Keyframed tracks and timed callbacks played back against one clock.
+
+    ``advance`` moves the clock, re-evaluates every track into ``values`` in
+    one pass and then fires, in time order, each event whose time was
+    crossed. ``seek`` jumps without firing anything.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.tracks: list[Track] = []
+        self.values: dict[str, float] = {}
+        self._event_times: list[float] = []
+        self._event_callbacks: list[Callable[[], None]] = []
+        self._next_event = 0
+
+    def add_track(self, name: str, *keyframes: Keyframe) -> Track:
+        track = Track.from_keyframes(name, list(keyframes))
+        self.tracks.append(track)
+        self.values[name] = track.sample(self.time)
+        return track
+
+    def add_event(self, time: float, callback: Callable[[], None]) -> None:
+        index = bisect.bisect_right(self._event_times, time)
+        self._event_times.insert(index, time)
+        self._event_callbacks.insert(index, callback)
+        if time <= self.time:
+            self._next_event += 1
+
+    @property
+    def event_times(self) -> list[float]:
+        return self._event_times
+
+    @property
+    def duration(self) -> float:
+        ends = [track.times[-1] for track in self.tracks] + self._event_times[-1:]
+        return max(ends, default=0.0)
+
+    @property
+    def finished(self) -> bool:
+        return self.time >= self.duration
+
+    def evaluate(self) -> dict[str, float]:
+        t = self.time
+        values = self.values
+        for track in self.tracks:
+            values[track.name] = track.sample(t)
+        return values
+
+    def advance(self, dt: float) -> None:
+        self.time += dt
+        self.evaluate()
+        times = self._event_times
+        while self._next_event < len(times) and times[self._next_event] <= self.time:
+            callback = self._event_callbacks[self._next_event]
+            self._next_event += 1
+            callback()
+
+    def seek(self, time: float) -> None:
+        """Jump to ``time``; events before it count as fired, later ones are re-armed."""
+        self.time = time
+        self._next_event = bisect.bisect_right(self._event_times, time)
+        self.evaluate()
+
+
+__all__ = ["EASINGS", "Keyframe", "Timeline", "Track"]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed-size ticks.
+
+    ``advance(dt)`` returns how many ticks to run this frame. After a long
+    stall (window drag, GC pause) at most ``max_steps`` ticks run and the rest
+    of the backlog is dropped, so the simulation slows down for a frame
+    instead of spiralling; ``dilated`` accumulates the wall time dropped that
+    way. ``alpha`` is how far the next tick has progressed, for interpolating
+    between the previous and current state when rendering.
+    """
+
+    def __init__(self, step: float, max_steps: int = 4):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dilated = 0.0
+
+    def advance(self, dt: float) -> int:
+        self.accumulator += dt
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step
+            self.dilated += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step)
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+
+
+__all__ = ["FixedTimestep"]
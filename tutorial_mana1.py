@@ -90,7 +90,7 @@ class ManaInfoScreen(Screen):
         self.background_color = BG_COLOR
         self.next_hint_text = HINT_TEXT
         self.next_hint_color = HINT_COLOR
-        self.mana_image = pygame.image.load(mana_image_path).convert_alpha()
+        self.mana_image = manager.assets.image(mana_image_path)
         bg_color = self.mana_image.get_at((0, 0))
         self.mana_image.set_colorkey(bg_color, pygame.RLEACCEL)
         self.mana_image_size = self.mana_image.get_size()
@@ -102,6 +102,9 @@ class ManaInfoScreen(Screen):
     def on_enter(self):
         self.hint_elapsed = 0.0
 
+    def upcoming(self) -> tuple[str, ...]:
+        return (self.next_screen,)
+
     def update(self, timestamp: float):
         self.hint_elapsed += timestamp
 
@@ -157,6 +160,9 @@ class ManaInfoScreen(Screen):
 
 
 class TutorialManaScreen1(ManaInfoScreen):
+    mana_image_path = "Mana_Original.png"
+    assets = (mana_image_path,)
+
     def __init__(self, manager: ScreenManager, font: pygame.font.Font):
         super().__init__(
             manager,
@@ -164,13 +170,16 @@ class TutorialManaScreen1(ManaInfoScreen):
             "This mana orb represents your energy.",
             "Mana will auto-regenerate over time.",
             "Making any action will consume mana.",
-            "Mana_Original.png",
+            self.mana_image_path,
             hint_delay=3.0,
             next_screen="TutorialManaScreen2",
         )
 
 
 class TutorialManaScreen2(ManaInfoScreen):
+    mana_image_path = "Mana_10.png"
+    assets = (mana_image_path,)
+
     def __init__(self, manager: ScreenManager, font: pygame.font.Font):
         super().__init__(
             manager,
@@ -178,13 +187,15 @@ class TutorialManaScreen2(ManaInfoScreen):
             "Your orb will show a number. This is your current mana.",
             "and increase as time passes.",
             "Your number will decrease as you make actions...",
-            "Mana_10.png",
+            self.mana_image_path,
             hint_delay=6.0,
             next_screen="TutorialManaScreen3",
         )
 
 
 class ActionTutorialScreen(Screen):
+    action_image_path = "Circular_Storm.png"
+
     def __init__(
         self,
         manager: ScreenManager,
@@ -203,8 +214,8 @@ class ActionTutorialScreen(Screen):
         self.enact_text = "Enact"
         self.text_color = TEXT_COLOR
         self.background_color = BG_COLOR
-        self.mana_image = pygame.image.load(mana_image_path).convert_alpha()
-        self.action_image = pygame.image.load("Circular_Storm.png").convert_alpha()
+        self.mana_image = manager.assets.image(mana_image_path)
+        self.action_image = manager.assets.image(self.action_image_path)
         bg_color = self.mana_image.get_at((0, 0))
         self.mana_image.set_colorkey(bg_color, pygame.RLEACCEL)
         self.mana_image_size = self.mana_image.get_size()
@@ -238,6 +249,9 @@ class ActionTutorialScreen(Screen):
         self.post_enact_started = False
         self.post_enact_timer = 0.0
 
+    def upcoming(self) -> tuple[str, ...]:
+        return (self.next_screen,)
+
     def update(self, timestamp: float):
         if self.enact_state == "waiting":
             self.enact_timer += timestamp
@@ -356,6 +370,9 @@ class ActionTutorialScreen(Screen):
 
 
 class TutorialManaScreen3(ActionTutorialScreen):
+    mana_image_path = "Mana_10.png"
+    assets = (mana_image_path, ActionTutorialScreen.action_image_path)
+
     def __init__(self, manager: ScreenManager, font: pygame.font.Font):
         super().__init__(
             manager,
@@ -363,7 +380,7 @@ class TutorialManaScreen3(ActionTutorialScreen):
             "Select Circular Storm to perform an action.",
             "This will consume mana, and deal damage to your opponent.",
             "Select 'Enact' to engage the action",
-            "Mana_10.png",
+            self.mana_image_path,
             next_screen="TutorialManaScreen4",
         )
 
@@ -397,6 +414,9 @@ class TutorialManaScreen4(Screen):
         self._text_finished = False
         self._post_text_started = False
 
+    def upcoming(self) -> tuple[str, ...]:
+        return ("TutorialManaScreen5",)
+
     def update(self, timestamp: float):
         if not self.text_visible and not self._text_finished:
             self.text_elapsed += timestamp
@@ -452,6 +472,9 @@ class TutorialManaScreen4(Screen):
 
 
 class TutorialManaScreen5(ActionTutorialScreen):
+    mana_image_path = "Mana_5.png"
+    assets = (mana_image_path, ActionTutorialScreen.action_image_path)
+
     def __init__(self, manager: ScreenManager, font: pygame.font.Font):
         super().__init__(
             manager,
@@ -459,6 +482,6 @@ class TutorialManaScreen5(ActionTutorialScreen):
             "",
             "",
             "",
-            "Mana_5.png",
+            self.mana_image_path,
             next_screen="TutorialManaScreen4",
         )
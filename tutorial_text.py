@@ -54,6 +54,9 @@ class TimedTextScreen(Screen):
             if self.post_secondary_elapsed >= self.post_secondary_delay:
                 self.manager.switch(self.next_screen)
 
+    def upcoming(self) -> tuple[str, ...]:
+        return (self.next_screen,)
+
     def render(self, surface: pygame.Surface):
         surface.fill(pygame.Color("black"))
         text_color = (235, 200, 110)